@@ -1,9 +1,16 @@
 """Prompt configuration for the Gemini commit analyzer."""
 
+import functools
+
+from uncommit.diff_cache import get_cached_diff
+from uncommit.git_ops import GitError, get_repo
+
 # The system prompt for the Gemini model
-# This defines how the AI should analyze and group git changes
+# This defines how the AI should analyze and group git changes. Only the core
+# rules and schema are sent on every request; the worked example is kept
+# separately since it costs tokens on each call without changing the schema.
 
-SYSTEM_PROMPT = """<role>
+SYSTEM_PROMPT_CORE = """<role>
 You are an expert software engineer specializing in git workflow optimization. You analyze code changes and organize them into clean, logical commits following best practices.
 </role>
 
@@ -16,6 +23,8 @@ You are an expert software engineer specializing in git workflow optimization. Y
 3. **Generate**: Create conventional commit messages for each group.
 4. **Validate**: Ensure all changed files are assigned to exactly one group.
 5. **Output**: Return a structured JSON response.
+
+For large changesets some diffs are omitted and marked "[diff available via get_file_diff tool]". Call get_file_diff(path) for any of those you need to decide a grouping.
 </instructions>
 
 <constraints>
@@ -43,16 +52,16 @@ Return ONLY a valid JSON object with this exact structure:
   "warnings": ["Optional: note any concerns or ambiguities"]
 }
 
-Field requirements:
 - index: 1-based integer, represents commit order
-- message: string, the full commit message
-- type: string, the conventional commit type
-- files: array of strings, file paths in this commit
-- reasoning: string, brief explanation of why these files are grouped
-- warnings: array of strings or null, optional notes about edge cases
+- reasoning: brief explanation of why these files are grouped
+- warnings: array of strings, or null if there is nothing to note
 </output_format>
 
-<example>
+<final_instruction>
+Think step-by-step: first analyze relationships between files, then create optimal groupings. Always verify every file is assigned before outputting.
+</final_instruction>"""
+
+SYSTEM_PROMPT_EXAMPLES = """<example>
 Input: Changed files include src/api/users.py (new endpoint), src/models/user.py (new model), README.md (updated docs), src/utils/format.py (fixed typo)
 
 Output:
@@ -82,11 +91,41 @@ Output:
   ],
   "warnings": null
 }
-</example>
+</example>"""
 
-<final_instruction>
-Think step-by-step: first analyze relationships between files, then create optimal groupings. Always verify every file is assigned before outputting.
-</final_instruction>"""
+# Full prompt (core rules plus example)
+SYSTEM_PROMPT = f"{SYSTEM_PROMPT_CORE}\n\n{SYSTEM_PROMPT_EXAMPLES}"
 
 # Default model to use
 DEFAULT_MODEL = "gemini-2.0-flash"
+
+# Maximum number of diffs embedded in the prompt; the rest are fetched on demand
+LAZY_DIFF_THRESHOLD = 20
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(api_key: str):
+    """Get the Gemini client for an API key, created once per process.
+
+    The client's async transport is bound to the event loop that first uses
+    it, so each command should drive all its requests from one asyncio.run.
+    """
+    import google.genai as genai
+
+    return genai.Client(api_key=api_key)
+
+
+def get_file_diff(path: str) -> str:
+    """Get the git diff of one uncommitted file against HEAD.
+
+    Args:
+        path: Path to the file relative to the repository root.
+
+    Returns:
+        The unified diff for the file; long diffs keep their first hunks and
+        list the line ranges of the rest.
+    """
+    try:
+        return get_cached_diff(get_repo(), path)
+    except GitError as e:
+        return f"[diff unavailable: {e}]"
@@ -2,33 +2,32 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import typer
+from pydantic import ValidationError
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.spinner import Spinner
-from rich.live import Live
 
-from uncommit.config import load_config
+from uncommit.config import Config, load_config
 from uncommit.git_ops import (
     get_repo,
     get_uncommitted_files,
-    get_diff,
+    get_changes_fingerprint,
+    reset_and_stage,
     stage_files,
     create_commit,
-    unstage_all,
     GitError,
     get_repo_root,
     get_last_commit,
     undo_last_commit,
 )
+from uncommit.diff_cache import clear_diff_cache, get_cached_diffs
 from uncommit.models import CommitGroup, SuggestionResult
+from uncommit.utils import JsonObjectScanner, dumps_json, extract_json_object
 
 app = typer.Typer(
     name="uncommit",
@@ -37,17 +36,51 @@ app = typer.Typer(
 )
 console = Console()
 
-# Cache file name (stored in repo root)
-CACHE_FILENAME = ".uncommit_cache.json"
+# Suggestion cache file, relative to the git dir (like the diff cache, so writing
+# it neither shows up as a change nor bumps the mtime of the repo root)
+CACHE_FILENAME = "uncommit/suggestions.json"
+
+# Fields that only key the suggestion cache and are left out of --json output
+_CACHE_FIELDS = {"fingerprint", "model"}
+
+# Colors for file statuses in 'analyze', with the Rich markup prebuilt per status
+_STATUS_COLORS = {
+    "added": "green",
+    "modified": "yellow",
+    "deleted": "red",
+    "renamed": "blue",
+}
+_STATUS_RENDER = {s: f"[{c}]{s}[/{c}]" for s, c in _STATUS_COLORS.items()}
+
+# Colors for conventional commit types in suggestion output
+_TYPE_COLORS = {
+    "feat": "green",
+    "fix": "red",
+    "refactor": "yellow",
+    "docs": "blue",
+    "chore": "magenta",
+    "style": "cyan",
+    "test": "white",
+    "perf": "green",
+    "ci": "magenta",
+    "build": "yellow",
+}
+
+# Background thread for diff prefetching (one job per suggest run)
+_DIFF_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def _is_own_file(path: str) -> bool:
+    """Check whether a repo path is one uncommit writes itself (area docs)."""
+    return path.startswith(".uncommit/")
 
 
 def _get_cache_path() -> Path:
-    """Get the path to the cache file in the current repo."""
+    """Get the path to the cache file in the current repo's git dir."""
     try:
-        repo = get_repo()
-        return get_repo_root(repo) / CACHE_FILENAME
+        return Path(get_repo().git_dir) / CACHE_FILENAME
     except GitError:
-        return Path.cwd() / CACHE_FILENAME
+        return Path.cwd() / ".uncommit_cache.json"
 
 
 def _load_cached_suggestions() -> SuggestionResult | None:
@@ -56,25 +89,33 @@ def _load_cached_suggestions() -> SuggestionResult | None:
     if not cache_path.exists():
         return None
     try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-            return SuggestionResult(**data)
+        return SuggestionResult.model_validate_json(cache_path.read_bytes())
     except Exception:
         return None
 
 
 def _save_cached_suggestions(result: SuggestionResult) -> None:
-    """Save suggestions to disk cache."""
+    """Save suggestions to disk cache.
+
+    Writes to a temporary file first and swaps it in, so an interrupted
+    write never leaves a truncated cache behind.
+    """
     cache_path = _get_cache_path()
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
     try:
-        with open(cache_path, "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(result.model_dump_json().encode())
+        os.replace(tmp_path, cache_path)
     except Exception:
-        pass  # Silently fail if we can't write cache
+        # Silently fail if we can't write cache
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 def _clear_cache() -> None:
-    """Clear the cache file."""
+    """Clear the cache file and any cached diffs."""
     cache_path = _get_cache_path()
     try:
         if cache_path.exists():
@@ -82,6 +123,11 @@ def _clear_cache() -> None:
     except Exception:
         pass
 
+    try:
+        clear_diff_cache(get_repo())
+    except GitError:
+        pass
+
 
 def _print_error(message: str) -> None:
     """Print an error message and exit."""
@@ -108,7 +154,7 @@ def analyze(
 
     if not changes:
         if json_output:
-            print(json.dumps({"files": [], "count": 0}))
+            print(dumps_json({"files": [], "count": 0}))
         else:
             console.print("[yellow]No uncommitted changes found.[/yellow]")
         return
@@ -118,40 +164,138 @@ def analyze(
             "files": [{"path": c.path, "status": c.status} for c in changes],
             "count": len(changes),
         }
-        print(json.dumps(output, indent=2))
+        print(dumps_json(output, indent=True))
     else:
+        from rich.table import Table
+
         table = Table(title=f"📂 Uncommitted Changes ({len(changes)} files)")
         table.add_column("Status", style="cyan", width=10)
         table.add_column("File", style="white")
 
-        status_colors = {
-            "added": "green",
-            "modified": "yellow",
-            "deleted": "red",
-            "renamed": "blue",
-        }
-
         for change in changes:
-            color = status_colors.get(change.status, "white")
-            table.add_row(f"[{color}]{change.status}[/{color}]", change.path)
+            table.add_row(_STATUS_RENDER.get(change.status, change.status), change.path)
 
         console.print(table)
 
-async def _run_agent_async(changes: list, model_override: str | None, config_model: str) -> str:
+
+def _diff_sections(repo, paths: list[str]) -> dict[str, str]:
+    """Build the prompt sections holding the given files' diffs."""
+    try:
+        diffs = get_cached_diffs(repo, paths)
+    except Exception:
+        diffs = {}
+    
+    sections: dict[str, str] = {}
+    for path in paths:
+        if path in diffs:
+            sections[path] = f"### {path}\n```diff\n{diffs[path]}\n```"
+        else:
+            sections[path] = f"### {path}\n[diff unavailable]"
+    return sections
+
+
+def _select_inline_diffs(repo, changes: list, limit: int) -> list[str]:
+    """Pick which files get their diff embedded in the prompt.
+
+    Smallest files (by worktree size) are embedded first; larger ones are
+    left for the model to request through the get_file_diff tool.
+    """
+    root = get_repo_root(repo)
+
+    def size(path: str) -> int:
+        try:
+            return os.stat(root / path).st_size
+        except OSError:
+            return 0
+
+    paths = [c.path for c in changes]
+    if len(paths) <= limit:
+        return paths
+    return sorted(paths, key=size)[:limit]
+
+
+def _prefetch_diffs(repo, changes: list) -> Future:
+    """Start fetching the diffs that will be embedded in the prompt.
+    
+    Returns a future resolving to a mapping of path to prompt section.
+    """
+    from uncommit.agent import LAZY_DIFF_THRESHOLD
+    
+    inline_paths = _select_inline_diffs(repo, changes, LAZY_DIFF_THRESHOLD)
+    return _DIFF_POOL.submit(_diff_sections, repo, inline_paths)
+
+
+# Single-file changesets whose diff touches at most this many lines skip the AI
+TRIVIAL_DIFF_LINES = 5
+
+_STATUS_VERBS = {
+    "added": "add",
+    "deleted": "remove",
+    "renamed": "rename",
+    "modified": "update",
+}
+
+
+def _trivial_suggestion(repo, changes: list) -> SuggestionResult | None:
+    """Build a suggestion locally for a single small change, skipping the AI.
+
+    Returns None when the changeset is not trivial (more than one file, or a
+    diff touching more than TRIVIAL_DIFF_LINES lines).
+    """
+    if len(changes) != 1:
+        return None
+
+    change = changes[0]
+    try:
+        diff = get_cached_diffs(repo, [change.path]).get(change.path, "")
+    except Exception:
+        return None
+
+    changed = sum(
+        1 for line in diff.split("\n")
+        if line[:1] in ("+", "-") and not line.startswith(("+++", "---"))
+    )
+    if not diff or changed > TRIVIAL_DIFF_LINES:
+        return None
+
+    path = Path(change.path)
+    scope = f"({path.parts[0]})" if len(path.parts) > 1 else ""
+    verb = _STATUS_VERBS.get(change.status, "update")
+    return SuggestionResult(
+        groups=[
+            CommitGroup(
+                index=1,
+                message=f"chore{scope}: {verb} {path.name}",
+                type="chore",
+                files=[change.path],
+                reasoning="Single small change, grouped without AI",
+            )
+        ],
+        warnings=None,
+    )
+
+
+async def _run_agent_async(
+    changes: list,
+    model_override: str | None,
+    config: Config,
+    prefetched: Future | None = None,
+) -> str:
     """Run the Gemini model to analyze changes with area context."""
-    import google.genai as genai
-    from uncommit.agent import SYSTEM_PROMPT, DEFAULT_MODEL
-    from uncommit.config import load_config
+    import asyncio
+    from google.genai import types
+    from uncommit.agent import SYSTEM_PROMPT_CORE, DEFAULT_MODEL, get_client, get_file_diff
     from uncommit.context import get_context_for_changes
     
-    # Get API key
-    config = load_config()
+    # Start diff collection early so git work overlaps with the area context step
+    if prefetched is None:
+        prefetched = _prefetch_diffs(get_repo(), changes)
     
     # Configure the client
-    client = genai.Client(api_key=config.api_key)
+    client = get_client(config.api_key)
     
     # Determine model
-    model_name = model_override or config_model or DEFAULT_MODEL
+    model_name = model_override or config.model or DEFAULT_MODEL
     
     # Get area context for the changed files
     changed_paths = [c.path for c in changes]
@@ -160,21 +304,22 @@ async def _run_agent_async(changes: list, model_override: str | None, config_mod
     # Build the file list as context
     file_list = "\n".join([f"- {c.path} ({c.status})" for c in changes])
     
-    # Get diffs for each file
-    from uncommit.git_ops import get_repo, get_diff
-    repo = get_repo()
-    diffs = []
-    for c in changes:
-        try:
-            diff = get_diff(repo, c.path)
-            if diff and len(diff) > 2000:
-                diff = diff[:2000] + "\n... [truncated]"
-            diffs.append(f"### {c.path}\n```diff\n{diff}\n```")
-        except Exception:
-            diffs.append(f"### {c.path}\n[diff unavailable]")
+    # Collect the inlined diffs (fetched in the background by the worker pool)
+    inline = await asyncio.wrap_future(prefetched)
     
+    # Remaining diffs are left for the model to fetch via the tool
+    diffs = [
+        inline.get(c.path, f"### {c.path}\n[diff available via get_file_diff tool]")
+        for c in changes
+    ]
     diff_context = "\n\n".join(diffs)
     
+    # Rules go in the system instruction; the tool is only offered when diffs were omitted
+    generate_config = types.GenerateContentConfig(
+        system_instruction=SYSTEM_PROMPT_CORE,
+        tools=[get_file_diff] if len(inline) < len(changes) else None,
+    )
+    
     # Build the full prompt with area context
     prompt = f"""Analyze these uncommitted git changes and group them into logical commits.
 
@@ -185,9 +330,7 @@ async def _run_agent_async(changes: list, model_override: str | None, config_mod
 {file_list}
 
 ## Diffs
-{diff_context}
-
-{SYSTEM_PROMPT}"""
+{diff_context}"""
     
     # Call the model with retry logic
     import time
@@ -196,11 +339,18 @@ async def _run_agent_async(changes: list, model_override: str | None, config_mod
     
     for attempt in range(max_retries):
         try:
-            response = await client.aio.models.generate_content(
+            # Stream the response and stop as soon as the JSON object is complete
+            scanner = JsonObjectScanner()
+            stream = await client.aio.models.generate_content_stream(
                 model=model_name,
                 contents=prompt,
+                config=generate_config,
             )
-            return response.text
+            async for chunk in stream:
+                json_text = scanner.feed(chunk.text or "")
+                if json_text is not None:
+                    return json_text
+            return scanner.text
         except Exception as e:
             last_error = e
             error_str = str(e).lower()
@@ -226,6 +376,7 @@ def suggest(
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
 ) -> None:
     """Use AI to suggest commit groups for your changes."""
+    import asyncio
 
     # Load config
     config = load_config()
@@ -246,100 +397,124 @@ def suggest(
 
     if not changes:
         if json_output:
-            print(json.dumps({"groups": [], "message": "No uncommitted changes found"}))
+            print(dumps_json({"groups": [], "message": "No uncommitted changes found"}))
         else:
             console.print("[yellow]No uncommitted changes found.[/yellow]")
         return
 
-    # Run the agent with spinner (Docker-style dots)
-    try:
-        if not json_output:
-            console.print()
-            with Live(
-                Spinner("dots", text=f"[cyan]Analyzing {len(changes)} changed files...[/cyan]"),
-                console=console,
-                transient=True,
-            ) as live:
-                response_text = asyncio.run(_run_agent_async(changes, model, config.model))
-        else:
-            response_text = asyncio.run(_run_agent_async(changes, model, config.model))
-        
-        # Parse the JSON response from the agent
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
-        if json_start == -1 or json_end == 0:
-            _print_error("Agent did not return valid JSON. Response:\n" + response_text[:500])
+    # Reuse cached suggestions if the changeset is exactly the one they were made for
+    # (area docs uncommit writes itself are ignored, since writing them would change
+    # the changeset); dry runs neither read nor write the cache
+    fingerprint = None
+    if not dry_run:
+        try:
+            fingerprint = get_changes_fingerprint(
+                repo, [c for c in changes if not _is_own_file(c.path)]
+            )
+        except GitError:
+            pass
+
+    # Suggestions the model made only count for that same model (e.g. not on a rerun
+    # with a different --model); trivial ones were made without any model
+    from uncommit.agent import DEFAULT_MODEL
+    model_name = model or config.model or DEFAULT_MODEL
+
+    if fingerprint:
+        cached = _load_cached_suggestions()
+        if (
+            cached is not None
+            and cached.groups
+            and cached.fingerprint == fingerprint
+            and cached.model in (None, model_name)
+        ):
+            if json_output:
+                print(cached.model_dump_json(exclude=_CACHE_FIELDS, indent=2))
+            else:
+                _print_suggestions(cached)
             return
+
+    # A single small change has only one sensible grouping; don't ask the model
+    result = _trivial_suggestion(repo, changes)
+    if result is None:
+        # Warm up diffs in the background while the spinner and model setup start
+        prefetched = _prefetch_diffs(repo, changes)
+
+        # Run the agent with spinner (Docker-style dots); skip it when not on a terminal
+        try:
+            if not json_output and console.is_terminal:
+                console.print()
+                with console.status(
+                    f"[cyan]Analyzing {len(changes)} changed files...[/cyan]", spinner="dots"
+                ):
+                    response_text = asyncio.run(_run_agent_async(changes, model, config, prefetched))
+            else:
+                response_text = asyncio.run(_run_agent_async(changes, model, config, prefetched))
+        
+            # Parse the JSON response from the agent
+            json_str = extract_json_object(response_text)
+            if json_str is None:
+                _print_error("Agent did not return valid JSON. Response:\n" + response_text[:500])
+                return
             
-        json_str = response_text[json_start:json_end]
-        result_data = json.loads(json_str)
-        result = SuggestionResult(**result_data)
+            result = SuggestionResult.model_validate_json(json_str)
+            result.model = model_name
 
-    except ImportError as e:
-        _print_error(f"Failed to import google-genai: {e}\nInstall with: pip install google-genai")
-        return
-    except json.JSONDecodeError as e:
-        _print_error(f"AI returned invalid JSON. Try running again.\nDetails: {e}")
-        return
-    except Exception as e:
-        error_msg = str(e).lower()
+        except ImportError as e:
+            _print_error(f"Failed to import google-genai: {e}\nInstall with: pip install google-genai")
+            return
+        except ValidationError as e:
+            _print_error(f"AI returned invalid JSON. Try running again.\nDetails: {e}")
+            return
+        except Exception as e:
+            error_msg = str(e).lower()
         
-        # Provide specific helpful messages for common errors
-        if "api_key" in error_msg or "api key" in error_msg or "unauthorized" in error_msg:
-            _print_error(
-                "Invalid or missing API key.\n"
-                "  1. Get a key at: https://aistudio.google.com/apikey\n"
-                "  2. Set it: export GOOGLE_API_KEY='your-key'"
-            )
-        elif "quota" in error_msg or "rate" in error_msg or "limit" in error_msg:
-            _print_error(
-                "API rate limit exceeded. Please wait a moment and try again.\n"
-                "  Tip: Use a different model with --model gemini-1.5-flash"
-            )
-        elif "network" in error_msg or "connection" in error_msg or "timeout" in error_msg:
-            _print_error(
-                "Network error. Check your internet connection and try again."
-            )
-        elif "model" in error_msg and ("not found" in error_msg or "invalid" in error_msg):
-            _print_error(
-                f"Model not found. Try: uncommit suggest --model gemini-2.0-flash\n"
-                f"  Details: {e}"
-            )
-        else:
-            _print_error(f"AI error: {e}")
-        return
+            # Provide specific helpful messages for common errors
+            if "api_key" in error_msg or "api key" in error_msg or "unauthorized" in error_msg:
+                _print_error(
+                    "Invalid or missing API key.\n"
+                    "  1. Get a key at: https://aistudio.google.com/apikey\n"
+                    "  2. Set it: export GOOGLE_API_KEY='your-key'"
+                )
+            elif "quota" in error_msg or "rate" in error_msg or "limit" in error_msg:
+                _print_error(
+                    "API rate limit exceeded. Please wait a moment and try again.\n"
+                    "  Tip: Use a different model with --model gemini-1.5-flash"
+                )
+            elif "network" in error_msg or "connection" in error_msg or "timeout" in error_msg:
+                _print_error(
+                    "Network error. Check your internet connection and try again."
+                )
+            elif "model" in error_msg and ("not found" in error_msg or "invalid" in error_msg):
+                _print_error(
+                    f"Model not found. Try: uncommit suggest --model gemini-2.0-flash\n"
+                    f"  Details: {e}"
+                )
+            else:
+                _print_error(f"AI error: {e}")
+            return
 
     # Cache results unless dry-run
     if not dry_run:
+        result.fingerprint = fingerprint
         _save_cached_suggestions(result)
 
     # Output results
     if json_output:
-        print(json.dumps(result.model_dump(), indent=2))
+        print(result.model_dump_json(exclude=_CACHE_FIELDS, indent=2))
     else:
         _print_suggestions(result)
 
 
 def _print_suggestions(result: SuggestionResult) -> None:
     """Pretty-print the suggestion results."""
+    from rich.panel import Panel
+
     console.print(Panel.fit("📦 [bold]Proposed Commits[/bold]", border_style="blue"))
     console.print()
 
     for group in result.groups:
         # Group header
-        type_colors = {
-            "feat": "green",
-            "fix": "red",
-            "refactor": "yellow",
-            "docs": "blue",
-            "chore": "magenta",
-            "style": "cyan",
-            "test": "white",
-            "perf": "green",
-            "ci": "magenta",
-            "build": "yellow",
-        }
-        color = type_colors.get(group.type, "white")
+        color = _TYPE_COLORS.get(group.type, "white")
         
         console.print(f"  [bold]\\[{group.index}][/bold] [{color}]{group.message}[/{color}]")
         
@@ -398,41 +573,51 @@ def commit(
             return
         groups_to_commit = [group]
 
-    # Commit each group
+    # Commit each group. The index only needs resetting before the first
+    # commit; each commit leaves it matching HEAD for the next group.
     committed_count = 0
-    for group in groups_to_commit:
-        # Interactive mode: show preview and ask for confirmation
-        if interactive:
-            console.print(f"\n[bold]\\[{group.index}][/bold] {group.message}")
-            for file in group.files:
-                console.print(f"    └─ {file}")
-            console.print(f"    [dim]{group.reasoning}[/dim]")
+    index_clean = False
+    try:
+        for group in groups_to_commit:
+            # Interactive mode: show preview and ask for confirmation
+            if interactive:
+                console.print(f"\n[bold]\\[{group.index}][/bold] {group.message}")
+                for file in group.files:
+                    console.print(f"    └─ {file}")
+                console.print(f"    [dim]{group.reasoning}[/dim]")
             
-            if not typer.confirm("\nCommit this group?"):
-                console.print("[dim]Skipped[/dim]")
-                continue
+                if not typer.confirm("\nCommit this group?"):
+                    console.print("[dim]Skipped[/dim]")
+                    continue
         
-        try:
-            # Unstage everything first
-            unstage_all(repo)
+            try:
+                # Stage exactly the files in this group
+                if index_clean:
+                    stage_files(repo, group.files)
+                else:
+                    reset_and_stage(repo, group.files)
             
-            # Stage files in this group
-            stage_files(repo, group.files)
+                # Commit with the message
+                commit_message = message if message else group.message
+                commit_hash = create_commit(repo, commit_message)
+                index_clean = True
+                clear_diff_cache(repo)
             
-            # Commit with the message
-            commit_message = message if message else group.message
-            commit_hash = create_commit(repo, commit_message)
+                _print_success(f"Committed: {commit_message} ([cyan]{commit_hash}[/cyan])")
+                committed_count += 1
             
-            _print_success(f"Committed: {commit_message} ([cyan]{commit_hash}[/cyan])")
-            committed_count += 1
+                # Remove this group from cached suggestions
+                # (the working tree changed, so the old fingerprint no longer applies)
+                cached_suggestions.groups = [g for g in cached_suggestions.groups if g.index != group.index]
+                cached_suggestions.fingerprint = None
             
-            # Remove this group from cached suggestions and save
-            cached_suggestions.groups = [g for g in cached_suggestions.groups if g.index != group.index]
+            except GitError as e:
+                _print_error(f"Failed to commit group {group.index}: {e}")
+                return
+    finally:
+        # Save progress once, even if a commit fails or the user aborts
+        if committed_count:
             _save_cached_suggestions(cached_suggestions)
-            
-        except GitError as e:
-            _print_error(f"Failed to commit group {group.index}: {e}")
-            return
 
     # Clear cache if all groups committed
     if not cached_suggestions.groups:
@@ -514,7 +699,7 @@ def undo(
         else:
             mode = "mixed"
         
-        undone = undo_last_commit(repo, mode=mode)
+        undone = undo_last_commit(repo, mode=mode, last_commit=last)
         _print_success(f"Undone: {undone.message} ({undone.hash})")
         
         if soft:
@@ -533,6 +718,7 @@ def init(
     This pre-generates documentation about each area of your codebase,
     which helps uncommit make smarter commit grouping decisions.
     """
+    import asyncio
     from uncommit.context import get_all_areas, is_area_stale, generate_area_doc
     
     config = load_config()
@@ -548,25 +734,30 @@ def init(
     
     console.print(f"\n[cyan]Found {len(areas)} areas:[/cyan] {', '.join(areas)}\n")
     
-    regenerated = 0
     cached = 0
+    to_generate: list[str] = []
     
     for area in areas:
-        stale = is_area_stale(area)
-        
-        if stale or force:
+        if force or is_area_stale(area):
+            to_generate.append(area)
+        else:
+            console.print(f"[dim]✓ Cached: {area}[/dim]")
+            cached += 1
+    
+    async def generate_all() -> int:
+        # One event loop for every request, so the shared client can be reused
+        generated = 0
+        for area in to_generate:
             with console.status(f"[cyan]Generating docs for {area}...[/cyan]"):
                 try:
-                    asyncio.run(generate_area_doc(area, config.api_key, config.model or "gemini-2.0-flash"))
+                    await generate_area_doc(area, config.api_key, config.model or "gemini-2.0-flash")
                     _print_success(f"Generated: {area}")
-                    regenerated += 1
+                    generated += 1
                 except Exception as e:
                     _print_error(f"Failed to generate {area}: {e}")
-        else:
-            with console.status(f"[dim]Loading {area}...[/dim]"):
-                pass  # Just show loading briefly
-            console.print(f"[dim]✓ Cached: {area}[/dim]")
-            cached += 1
+        return generated
+    
+    regenerated = asyncio.run(generate_all()) if to_generate else 0
     
     console.print(f"\n[green]Done![/green] {cached} cached, {regenerated} regenerated.")
     console.print("[dim]Docs saved to .uncommit/areas/[/dim]")
@@ -578,7 +769,7 @@ def reset() -> None:
     
     Run 'uncommit init' after this to regenerate fresh docs.
     """
-    from uncommit.context import get_uncommit_dir
+    from uncommit.context import clear_area_cache, get_uncommit_dir
     import shutil
     
     uncommit_dir = get_uncommit_dir()
@@ -586,6 +777,7 @@ def reset() -> None:
     
     if areas_dir.exists():
         shutil.rmtree(areas_dir)
+        clear_area_cache()
         _print_success("Area docs cleared")
     else:
         console.print("[yellow]No area docs to clear[/yellow]")
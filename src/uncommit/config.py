@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -34,10 +35,14 @@ class Config(BaseModel):
         return base / "uncommit" / "config.toml"
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
     """Load configuration from environment variables and config file.
     
     Priority: Environment variables > .env.local > Config file > Defaults
+    
+    The result is cached for the life of the process; call
+    load_config.cache_clear() to re-read it.
     """
     # Load .env.local if it exists (for local development)
     from pathlib import Path
@@ -8,12 +8,17 @@ Designed to be convertible to ADK tools in the future.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import hashlib
+import os
+from collections import deque
 from pathlib import Path
 from typing import Any
 
 from uncommit.git_ops import get_repo, get_repo_root
+from uncommit.utils import extract_json_object, loads_json
 
 
 # Directory names to skip when analyzing
@@ -31,6 +36,18 @@ CODE_EXTENSIONS = {
     ".json", ".toml", ".md", ".rst", ".txt"
 }
 
+# Bytes read from each file when building area doc previews
+PREVIEW_BYTES = 2048
+
+# Number of stale areas at which their docs are generated in a single request
+BULK_AREA_THRESHOLD = 3
+
+# What each generated area doc should cover
+AREA_DOC_SECTIONS = """1. **Purpose**: What this area does (1-2 sentences)
+2. **Key Files**: Brief description of each file's role
+3. **Patterns**: Common patterns or conventions used
+4. **Dependencies**: What this area depends on or provides"""
+
 
 def get_uncommit_dir() -> Path:
     """Get the .uncommit directory in the repo root, creating if needed."""
@@ -58,25 +75,32 @@ def get_area_for_file(file_path: str) -> str:
     Returns:
         Area name (e.g., "src_uncommit", "tests", "root")
     """
-    path = Path(file_path)
-    parts = path.parts
-    
-    if len(parts) == 1:
+    # Plain string scanning (git paths always use "/"), no Path parsing
+    slash = file_path.find("/")
+    if slash < 0:
         # Root-level file
         return "root"
     
+    first = file_path[:slash]
+    
     # Use first 1-2 levels for area name
-    if len(parts) >= 2 and parts[0] == "src":
+    if first == "src":
         # src/package/ -> src_package
-        return f"{parts[0]}_{parts[1]}"
+        rest = file_path[slash + 1:]
+        end = rest.find("/")
+        return f"src_{rest if end < 0 else rest[:end]}"
     
     # Otherwise just use first directory
-    return parts[0].replace("-", "_").replace(".", "_")
+    return first.replace("-", "_").replace(".", "_")
 
 
+@functools.lru_cache(maxsize=64)
 def get_area_files(area: str) -> list[Path]:
     """Get all code files in an area.
     
+    Results are cached for the life of the process (see clear_area_cache);
+    callers must not mutate the returned list.
+    
     Args:
         area: Area name.
     
@@ -104,29 +128,32 @@ def get_area_files(area: str) -> list[Path]:
     
     files: list[Path] = []
     
-    def walk(path: Path, depth: int):
-        if depth > max_depth:
-            return
-        
+    # Iterative scandir walk: DirEntry type checks come from the directory
+    # listing itself, so most entries need no extra stat call
+    pending: deque[tuple[str, int]] = deque([(str(search_dir), 0)])
+    while pending:
+        path, depth = pending.popleft()
         try:
-            for entry in path.iterdir():
-                if entry.name in SKIP_DIRS or entry.name.startswith("."):
-                    continue
-                
-                if entry.is_file():
-                    if area == "root" and depth > 0:
-                        continue  # For root, only include direct children
-                    if entry.suffix in CODE_EXTENSIONS or entry.name in {"Makefile", "Dockerfile"}:
-                        files.append(entry.relative_to(repo_root))
-                elif entry.is_dir() and area != "root":
-                    walk(entry, depth + 1)
-        except PermissionError:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name in SKIP_DIRS or name.startswith("."):
+                        continue
+                    
+                    if entry.is_file():
+                        if area == "root" and depth > 0:
+                            continue  # For root, only include direct children
+                        if os.path.splitext(name)[1] in CODE_EXTENSIONS or name in {"Makefile", "Dockerfile"}:
+                            files.append(Path(entry.path).relative_to(repo_root))
+                    elif area != "root" and depth < max_depth and entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, depth + 1))
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
             pass
     
-    walk(search_dir, 0)
     return sorted(files)
 
 
+@functools.lru_cache(maxsize=64)
 def get_area_hash(area: str) -> str:
     """Get a hash of the area's structure for staleness detection.
     
@@ -134,11 +161,17 @@ def get_area_hash(area: str) -> str:
         area: Area name.
     
     Returns:
-        MD5 hash of file list.
+        12-character BLAKE2b hash of file list.
     """
     files = get_area_files(area)
     file_list = "\n".join(str(f) for f in files)
-    return hashlib.md5(file_list.encode()).hexdigest()[:12]
+    return hashlib.blake2b(file_list.encode(), digest_size=6).hexdigest()
+
+
+def clear_area_cache() -> None:
+    """Forget cached area file lists and hashes (after the worktree changes)."""
+    get_area_files.cache_clear()
+    get_area_hash.cache_clear()
 
 
 def load_area_doc(area: str) -> str | None:
@@ -160,6 +193,21 @@ def load_area_doc(area: str) -> str | None:
         return None
 
 
+def _area_mtime(area: str) -> int | None:
+    """Get a directory mtime that fully determines an area's file list.
+    
+    A directory's mtime only changes when its direct entries change, so this
+    is only meaningful for the root area, which lists root-level files only.
+    Nested areas return None and always go through get_area_hash.
+    """
+    if area != "root":
+        return None
+    try:
+        return os.stat(get_repo_root(get_repo())).st_mtime_ns
+    except OSError:
+        return None
+
+
 def save_area_doc(area: str, content: str, structure_hash: str) -> None:
     """Save area documentation to disk.
     
@@ -170,8 +218,11 @@ def save_area_doc(area: str, content: str, structure_hash: str) -> None:
     """
     doc_path = get_areas_dir() / f"{area}.md"
     
-    # Prepend hash as first line for staleness detection
-    full_content = f"<!-- hash:{structure_hash} -->\n{content}"
+    # Prepend hash (and, when usable, the area's mtime) as first line for
+    # staleness detection
+    mtime = _area_mtime(area)
+    stamp = f"{structure_hash} mtime:{mtime}" if mtime is not None else structure_hash
+    full_content = f"<!-- hash:{stamp} -->\n{content}"
     
     try:
         doc_path.write_text(full_content, encoding="utf-8")
@@ -179,66 +230,128 @@ def save_area_doc(area: str, content: str, structure_hash: str) -> None:
         pass
 
 
-def is_area_stale(area: str) -> bool:
-    """Check if an area's documentation is stale.
+def _parse_doc_header(line: str) -> tuple[str, str | None] | None:
+    """Parse an area doc's "<!-- hash:H mtime:N -->" line (mtime is optional).
+    
+    Returns:
+        (hash, mtime or None), or None if the line is not a doc header.
+    """
+    if not (line.startswith("<!-- ") and line.endswith(" -->")):
+        return None
+    fields = line[len("<!-- "):-len(" -->")]
+    if not fields.startswith("hash:"):
+        return None
+    
+    stored_hash, sep, mtime = fields[len("hash:"):].partition(" mtime:")
+    return stored_hash, (mtime if sep else None)
+
+
+def load_area_doc_if_fresh(area: str) -> str | None:
+    """Load an area's documentation if it is still up to date.
     
     Args:
         area: Area name.
     
     Returns:
-        True if stale/missing, False if fresh.
+        The doc content without its hash line, or None if stale/missing.
     """
     doc = load_area_doc(area)
     if doc is None:
-        return True
+        return None
     
-    # Extract stored hash from first line
-    first_line = doc.split("\n")[0]
-    if not first_line.startswith("<!-- hash:"):
-        return True
+    # Extract stored hash (and mtime) from first line
+    first_line, _, body = doc.partition("\n")
+    header = _parse_doc_header(first_line)
+    if header is None:
+        return None
+    stored_hash, stored_mtime = header
+    
+    # Unchanged directory mtime means an unchanged file list; skip the walk
+    if stored_mtime is not None:
+        mtime = _area_mtime(area)
+        if mtime is not None and stored_mtime == str(mtime):
+            return body
     
-    stored_hash = first_line[10:22]  # Extract hash from <!-- hash:XXXX -->
     current_hash = get_area_hash(area)
     
-    return stored_hash != current_hash
+    return body if stored_hash == current_hash else None
 
 
-async def generate_area_doc(area: str, api_key: str, model: str = "gemini-2.0-flash") -> str:
-    """Generate documentation for an area using Gemini.
+def is_area_stale(area: str) -> bool:
+    """Check if an area's documentation is stale.
     
     Args:
         area: Area name.
-        api_key: Google API key.
-        model: Model to use.
     
     Returns:
-        Generated documentation.
+        True if stale/missing, False if fresh.
     """
-    import google.genai as genai
+    return load_area_doc_if_fresh(area) is None
+
+
+def _read_head(path: Path, max_bytes: int = PREVIEW_BYTES) -> str | None:
+    """Read the start of a file for a preview, or None if it can't be read."""
+    try:
+        with open(path, "rb", buffering=0) as f:
+            return f.read(max_bytes).decode("utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+async def _area_file_context(area: str) -> str | None:
+    """Build the file preview section of an area doc prompt.
     
+    Returns:
+        Previews of up to 20 files in the area, or None if it has no files.
+    """
     files = get_area_files(area)
     if not files:
-        return f"# Area: {area}\n\nEmpty or non-existent area."
+        return None
     
-    # Build file list with first few lines of each file
-    file_info: list[str] = []
+    # Build file list with first few lines of each file (read concurrently)
     repo = get_repo()
     repo_root = get_repo_root(repo)
     
-    for f in files[:20]:  # Limit to 20 files
-        full_path = repo_root / f
-        try:
-            content = full_path.read_text(encoding="utf-8")
-            # Get first 10 lines or docstring
-            lines = content.split("\n")[:10]
-            preview = "\n".join(lines)
-            if len(preview) > 500:
-                preview = preview[:500] + "..."
-            file_info.append(f"### {f}\n```\n{preview}\n```")
-        except Exception:
+    sample = files[:20]  # Limit to 20 files
+    heads = await asyncio.gather(
+        *(asyncio.to_thread(_read_head, repo_root / f) for f in sample)
+    )
+    
+    file_info: list[str] = []
+    for f, head in zip(sample, heads):
+        if head is None:
             file_info.append(f"### {f}\n[unreadable]")
+            continue
+        # Get first 10 lines or docstring
+        preview = "\n".join(head.split("\n")[:10])
+        if len(preview) > 500:
+            preview = preview[:500] + "..."
+        file_info.append(f"### {f}\n```\n{preview}\n```")
     
-    file_context = "\n\n".join(file_info)
+    return "\n\n".join(file_info)
+
+
+def _empty_area_doc(area: str) -> str:
+    """Placeholder doc for an area without files (not cached)."""
+    return f"# Area: {area}\n\nEmpty or non-existent area."
+
+
+async def generate_area_doc(area: str, api_key: str, model: str = "gemini-2.0-flash") -> str:
+    """Generate documentation for an area using Gemini.
+    
+    Args:
+        area: Area name.
+        api_key: Google API key.
+        model: Model to use.
+    
+    Returns:
+        Generated documentation.
+    """
+    from uncommit.agent import get_client
+    
+    file_context = await _area_file_context(area)
+    if file_context is None:
+        return _empty_area_doc(area)
     
     prompt = f"""Analyze this codebase area and create concise documentation.
 
@@ -249,14 +362,11 @@ async def generate_area_doc(area: str, api_key: str, model: str = "gemini-2.0-fl
 
 ## Task
 Write a brief documentation file (50-100 lines max) covering:
-1. **Purpose**: What this area does (1-2 sentences)
-2. **Key Files**: Brief description of each file's role
-3. **Patterns**: Common patterns or conventions used
-4. **Dependencies**: What this area depends on or provides
+{AREA_DOC_SECTIONS}
 
 Format as clean markdown. Be concise. Focus on information useful for understanding commit context."""
 
-    client = genai.Client(api_key=api_key)
+    client = get_client(api_key)
     response = await client.aio.models.generate_content(
         model=model,
         contents=prompt,
@@ -271,6 +381,83 @@ Format as clean markdown. Be concise. Focus on information useful for understand
     return doc_content
 
 
+async def generate_area_docs_bulk(
+    areas: list[str],
+    api_key: str,
+    model: str = "gemini-2.0-flash",
+) -> dict[str, str]:
+    """Generate documentation for several areas with a single Gemini request.
+    
+    The model returns all docs as one JSON object. Areas it leaves out (or
+    all of them, if the response can't be parsed) are generated one by one
+    with generate_area_doc instead.
+    
+    Args:
+        areas: Area names.
+        api_key: Google API key.
+        model: Model to use.
+    
+    Returns:
+        Mapping of area name to generated documentation.
+    """
+    from uncommit.agent import get_client
+    
+    contexts = await asyncio.gather(*(_area_file_context(area) for area in areas))
+    
+    docs: dict[str, str] = {}
+    sections: list[str] = []
+    for area, file_context in zip(areas, contexts):
+        if file_context is None:
+            docs[area] = _empty_area_doc(area)
+        else:
+            sections.append(f"=== AREA: {area} ===\n{file_context}")
+    
+    if sections:
+        all_sections = "\n\n".join(sections)
+        prompt = f"""Analyze these codebase areas and create concise documentation for each.
+
+{all_sections}
+
+## Task
+For each area, write a brief documentation file (50-100 lines max) covering:
+{AREA_DOC_SECTIONS}
+
+Use clean markdown. Be concise. Focus on information useful for understanding commit context.
+
+Return ONLY a JSON object of the form {{"areas": {{"<area name>": "<markdown doc>"}}}} with one entry per area above."""
+
+        client = get_client(api_key)
+        response = await client.aio.models.generate_content(
+            model=model,
+            contents=prompt,
+        )
+        
+        generated: dict = {}
+        json_str = extract_json_object(response.text or "")
+        if json_str is not None:
+            try:
+                generated = loads_json(json_str).get("areas")
+            except ValueError:
+                pass
+        if not isinstance(generated, dict):
+            generated = {}
+        
+        for area in areas:
+            doc = generated.get(area)
+            if area not in docs and isinstance(doc, str) and doc:
+                save_area_doc(area, doc, get_area_hash(area))
+                docs[area] = doc
+    
+    # Anything the bulk response didn't cover goes through the per-area path
+    missing = [area for area in areas if area not in docs]
+    for area, doc in zip(missing, await asyncio.gather(
+        *(generate_area_doc(area, api_key, model) for area in missing)
+    )):
+        docs[area] = doc
+    
+    return docs
+
+
 async def get_context_for_changes(
     changed_files: list[str],
     api_key: str,
@@ -286,27 +473,34 @@ async def get_context_for_changes(
     Returns:
         Combined context from all affected areas.
     """
-    # Determine affected areas
+    # Determine affected areas; files in the same directory share an area,
+    # so it is derived once per directory
     areas: set[str] = set()
+    area_by_dir: dict[str, str] = {}
     for f in changed_files:
-        areas.add(get_area_for_file(f))
-    
-    # Load or generate docs for each area
-    context_parts: list[str] = []
-    
-    for area in sorted(areas):
-        if is_area_stale(area):
-            # Generate fresh doc
-            doc = await generate_area_doc(area, api_key, model)
-        else:
-            # Load cached doc
-            doc = load_area_doc(area)
-            # Remove hash line
-            if doc and doc.startswith("<!-- hash:"):
-                doc = "\n".join(doc.split("\n")[1:])
-        
-        if doc:
-            context_parts.append(doc)
+        directory = f.rpartition("/")[0]
+        area = area_by_dir.get(directory)
+        if area is None:
+            area = get_area_for_file(f)
+            if directory != "src":  # Areas of files directly in src/ depend on the name
+                area_by_dir[directory] = area
+        areas.add(area)
+    
+    # Load fresh docs; regenerate the stale ones in one request when there
+    # are several, otherwise concurrently one request per area
+    ordered = sorted(areas)
+    docs = {area: load_area_doc_if_fresh(area) for area in ordered}
+    stale = [area for area, doc in docs.items() if doc is None]
+    
+    if len(stale) >= BULK_AREA_THRESHOLD:
+        docs.update(await generate_area_docs_bulk(stale, api_key, model))
+    elif stale:
+        generated = await asyncio.gather(
+            *(generate_area_doc(area, api_key, model) for area in stale)
+        )
+        docs.update(zip(stale, generated))
+    
+    context_parts = [docs[area] for area in ordered if docs[area]]
     
     return "\n\n---\n\n".join(context_parts)
 
@@ -322,13 +516,20 @@ def get_all_areas() -> list[str]:
     
     areas: set[str] = {"root"}
     
-    for entry in repo_root.iterdir():
-        if entry.is_dir() and entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+    # Name checks come first so skipped entries never need a type check;
+    # DirEntry.is_dir() reuses the type from the directory listing
+    with os.scandir(repo_root) as it:
+        for entry in it:
+            if entry.name in SKIP_DIRS or entry.name.startswith("."):
+                continue
+            if not entry.is_dir(follow_symlinks=False):
+                continue
             if entry.name == "src":
                 # Check for packages inside src
-                for subentry in entry.iterdir():
-                    if subentry.is_dir() and not subentry.name.startswith("."):
-                        areas.add(f"src_{subentry.name}")
+                with os.scandir(entry.path) as sub_it:
+                    for subentry in sub_it:
+                        if not subentry.name.startswith(".") and subentry.is_dir(follow_symlinks=False):
+                            areas.add(f"src_{subentry.name}")
             else:
                 areas.add(entry.name)
     
@@ -0,0 +1,190 @@
+"""Content-keyed diff cache for uncommit.
+
+Diffs are summarized (see diff_summary) and cached in two layers: an
+in-process dict and files on disk under the repository's git directory.
+Keys are derived from the file's worktree stat, the index stat and the HEAD
+commit, so any change to the file, the staging area or the base commit
+produces a new key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+
+from git import Repo, SymbolicReference
+
+from uncommit.diff_summary import iter_diff_lines, summarize_diff
+from uncommit.git_ops import (
+    MAX_DIFF_BYTES,
+    GitError,
+    get_diffs_batch,
+    get_repo_root,
+    iter_diff,
+)
+
+# Cache directory (inside the git dir so cached diffs never show up as changes)
+DIFF_CACHE_DIRNAME = "uncommit/diffs"
+
+# Seconds before a cached diff is considered too old to trust
+DIFF_CACHE_TTL = 300
+
+# In-process layer: key -> (timestamp, diff)
+_MEM: dict[str, tuple[float, str]] = {}
+
+# When expired entries were last swept (at most once per DIFF_CACHE_TTL)
+_last_sweep = 0.0
+
+
+def get_diff_cache_dir(repo: Repo) -> Path:
+    """Get the on-disk diff cache directory for a repository."""
+    return Path(repo.git_dir) / DIFF_CACHE_DIRNAME
+
+
+def _stat_token(path: Path) -> str:
+    """Return a cheap change token for a file (mtime + size), or 'missing'."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "missing"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _base_token(repo: Repo) -> str:
+    """Return the part of the cache key shared by all files (HEAD + index)."""
+    # Resolve HEAD from the ref files; repo.head.commit goes through the shared
+    # cat-file process, which is not safe to use from worker threads
+    try:
+        head = SymbolicReference.dereference_recursive(repo, "HEAD")
+    except ValueError:
+        head = "none"
+    return f"{head}\0{_stat_token(Path(repo.git_dir) / 'index')}"
+
+
+def _diff_key(repo: Repo, file_path: str, base: str) -> str:
+    """Compute the cache key for a file's diff against HEAD."""
+    parts = (file_path, base, _stat_token(get_repo_root(repo) / file_path))
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _lookup(repo: Repo, key: str, now: float) -> str | None:
+    """Find a fresh cached diff in memory or on disk."""
+    # 1. In-process layer
+    hit = _MEM.get(key)
+    if hit is not None and now - hit[0] < DIFF_CACHE_TTL:
+        return hit[1]
+
+    # 2. On-disk layer
+    cache_file = get_diff_cache_dir(repo) / f"{key}.diff"
+    try:
+        mtime = cache_file.stat().st_mtime
+        if now - mtime < DIFF_CACHE_TTL:
+            diff = cache_file.read_text(encoding="utf-8")
+            _MEM[key] = (mtime, diff)
+            return diff
+    except OSError:
+        pass
+
+    return None
+
+
+def _sweep(repo: Repo, now: float) -> None:
+    """Delete expired entries from both cache layers."""
+    for key in [k for k, (stamp, _) in _MEM.items() if now - stamp >= DIFF_CACHE_TTL]:
+        del _MEM[key]
+
+    try:
+        with os.scandir(get_diff_cache_dir(repo)) as entries:
+            for entry in entries:
+                try:
+                    if now - entry.stat().st_mtime >= DIFF_CACHE_TTL:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass  # No cache directory yet
+
+
+def _store(repo: Repo, key: str, diff: str, now: float) -> None:
+    """Store a diff in both cache layers, sweeping expired entries now and then."""
+    global _last_sweep
+    if now - _last_sweep >= DIFF_CACHE_TTL:
+        _last_sweep = now
+        _sweep(repo, now)
+
+    _MEM[key] = (now, diff)
+    cache_file = get_diff_cache_dir(repo) / f"{key}.diff"
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(diff, encoding="utf-8")
+    except OSError:
+        pass  # Disk cache is best-effort
+
+
+def get_cached_diff(repo: Repo, file_path: str) -> str:
+    """Get the summarized diff for a file, reusing a cached copy when nothing changed.
+
+    Args:
+        repo: The git Repo object.
+        file_path: Path to the file relative to repo root.
+
+    Returns:
+        The summarized diff content as a string.
+
+    Raises:
+        GitError: If the diff has to be computed and that fails.
+    """
+    key = _diff_key(repo, file_path, _base_token(repo))
+    now = time.time()
+
+    diff = _lookup(repo, key, now)
+    if diff is None:
+        # Summarize while streaming, so a huge diff is never held in full
+        try:
+            chunks = iter_diff(repo, file_path, max_bytes=MAX_DIFF_BYTES)
+            diff = summarize_diff(iter_diff_lines(chunks))
+        except GitError as e:
+            raise GitError(f"Failed to get diff: {e}")
+        _store(repo, key, diff, now)
+    return diff
+
+
+def get_cached_diffs(repo: Repo, file_paths: list[str]) -> dict[str, str]:
+    """Get summarized diffs for many files, computing all misses in one batch.
+
+    Args:
+        repo: The git Repo object.
+        file_paths: Paths relative to repo root.
+
+    Returns:
+        Mapping of file path to summarized diff. Files whose diff could not
+        be computed are left out.
+    """
+    base = _base_token(repo)
+    now = time.time()
+
+    diffs: dict[str, str] = {}
+    missing: dict[str, str] = {}
+    for path in file_paths:
+        key = _diff_key(repo, path, base)
+        diff = _lookup(repo, key, now)
+        if diff is None:
+            missing[path] = key
+        else:
+            diffs[path] = diff
+
+    for path, raw in get_diffs_batch(repo, list(missing)).items():
+        diff = summarize_diff(raw)
+        _store(repo, missing[path], diff, now)
+        diffs[path] = diff
+
+    return diffs
+
+
+def clear_diff_cache(repo: Repo) -> None:
+    """Drop every cached diff for a repository (memory and disk)."""
+    _MEM.clear()
+    shutil.rmtree(get_diff_cache_dir(repo), ignore_errors=True)
@@ -0,0 +1,103 @@
+"""Hunk-aware diff summarization for uncommit.
+
+Large diffs are shortened by whole hunks instead of by character count, so
+the model always sees structurally complete hunks plus the line ranges of
+anything that was left out.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from typing import Iterable, Iterator
+
+# Matches unified diff hunk headers: @@ -a,b +c,d @@
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def _format_range(start: int, count: int) -> str:
+    """Format a hunk's new-side line range as 'L1-L2' (or 'L1' for one line)."""
+    if count <= 1:
+        return str(start)
+    return f"{start}-{start + count - 1}"
+
+
+def iter_diff_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode streamed diff output (see git_ops.iter_diff) into lines."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def summarize_diff(
+    diff_text: str | Iterable[str], max_hunks: int = 6, max_lines_per_hunk: int = 40
+) -> str:
+    """Shorten a single-file diff while keeping hunks intact.
+
+    File headers are kept as-is. The first ``max_hunks`` hunks are kept
+    verbatim up to ``max_lines_per_hunk`` lines each; remaining hunks are
+    replaced by a note listing the line ranges they cover.
+
+    Args:
+        diff_text: Unified diff for one file, as text or as an iterable of
+            lines (so a streamed diff never has to be held in full).
+        max_hunks: Number of hunks to keep.
+        max_lines_per_hunk: Number of body lines to keep per hunk.
+
+    Returns:
+        The summarized diff.
+    """
+    if isinstance(diff_text, str):
+        if not diff_text:
+            return diff_text
+        diff_text = diff_text.split("\n")
+
+    out: list[str] = []
+    omitted_ranges: list[str] = []
+    hunk_count = 0
+    hunk_lines = 0
+    hunk_overflow = 0
+
+    def close_hunk() -> None:
+        if hunk_overflow:
+            out.append(f"... [{hunk_overflow} more lines in this hunk]")
+
+    for line in diff_text:
+        match = _HUNK_RE.match(line)
+        if match:
+            close_hunk()
+            hunk_count += 1
+            hunk_lines = 0
+            hunk_overflow = 0
+            if hunk_count > max_hunks:
+                start = int(match.group(3))
+                count = int(match.group(4)) if match.group(4) is not None else 1
+                omitted_ranges.append(_format_range(start, count))
+            else:
+                out.append(line)
+            continue
+
+        if hunk_count == 0:
+            # File header (diff --git, index, ---/+++ lines)
+            out.append(line)
+        elif hunk_count <= max_hunks:
+            if hunk_lines < max_lines_per_hunk:
+                out.append(line)
+                hunk_lines += 1
+            else:
+                hunk_overflow += 1
+
+    close_hunk()
+
+    if omitted_ranges:
+        out.append(
+            f"[{len(omitted_ranges)} more hunks covering lines {', '.join(omitted_ranges)}]"
+        )
+
+    return "\n".join(out)
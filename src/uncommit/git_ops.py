@@ -2,23 +2,79 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import re
+import stat
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
-from git import Repo
+from git import Git, Repo
 from git.exc import InvalidGitRepositoryError, GitCommandError
 
 from uncommit.models import FileChange, CommitInfo
 
 
+# Directory names left out of get_directory_structure
+STRUCTURE_SKIP_DIRS = frozenset({
+    ".git", "__pycache__", "node_modules", ".venv", "venv", ".tox", ".pytest_cache",
+})
+
+# Splits combined `git diff` output into per-file sections (matched on raw bytes)
+_DIFF_SECTION_RE = re.compile(rb"^diff --git ", re.M)
+
+# Unquoted header paths; the backreference copes with spaces in the path
+_PLAIN_HEADER_RE = re.compile(rb"a/(.+?) b/\1")
+
+# Escapes git uses in C-quoted paths (octal \NNN is handled separately)
+_C_ESCAPES = {
+    b"a": 7, b"b": 8, b"t": 9, b"n": 10, b"v": 11, b"f": 12, b"r": 13,
+    b'"': 34, b"\\": 92,
+}
+
+# Files larger than this are truncated by get_file_content
+MAX_FILE_BYTES = 10_000
+
+# A NUL byte within this many leading bytes marks a file as binary (as in git)
+BINARY_CHECK_BYTES = 8000
+
+# Per-file diff size read by get_diffs_batch for untracked files and for its
+# fallback (a single new-file hunk is summarized to a few dozen lines anyway)
+MAX_DIFF_BYTES = 64_000
+
+# Read size for streamed git output
+DIFF_CHUNK_BYTES = 64 * 1024
+
+# Upper bound on concurrent per-file git processes in get_diffs_batch
+MAX_DIFF_WORKERS = 32
+
+
 class GitError(Exception):
     """Custom exception for git operation errors."""
     pass
 
 
+def _git_command(*args: str) -> list[str]:
+    """Build a command line for Git.execute, using GitPython's configured git."""
+    return [Git.GIT_PYTHON_GIT_EXECUTABLE or "git", *args]
+
+
+@functools.lru_cache(maxsize=4)
+def _open_repo(path: Path) -> Repo:
+    """Open (and memoize) the repository containing a resolved path."""
+    return Repo(path, search_parent_directories=True)
+
+
 def get_repo(path: str | Path = ".") -> Repo:
     """Get the git repository at the given path.
     
+    Repo handles are cached per resolved path, so repeated calls within one
+    command reuse the same object instead of re-reading config and index.
+    
     Args:
         path: Path to the repository root. Defaults to current directory.
     
@@ -29,92 +85,261 @@ def get_repo(path: str | Path = ".") -> Repo:
         GitError: If the path is not a valid git repository.
     """
     try:
-        return Repo(path, search_parent_directories=True)
+        return _open_repo(Path(path).resolve())
     except InvalidGitRepositoryError:
         raise GitError(f"Not a git repository: {path}")
 
 
+def invalidate_repo_cache() -> None:
+    """Drop cached Repo handles after operations that move HEAD or the index."""
+    _open_repo.cache_clear()
+
+
 def get_repo_root(repo: Repo) -> Path:
     """Get the root directory of the repository.
     
+    The Path is built once and stored on the Repo object, since a Repo's
+    working directory never changes.
+    
     Args:
         repo: The git Repo object.
     
     Returns:
         Path to the repository root.
     """
-    return Path(repo.working_dir)
+    root = getattr(repo, "_uncommit_root", None)
+    if root is None:
+        root = Path(repo.working_dir)
+        repo._uncommit_root = root
+    return root
+
+
+# Porcelain status letters -> FileChange status
+_PORCELAIN_STATUS = {
+    "A": "added",
+    "C": "added",
+    "D": "deleted",
+    "R": "renamed",
+    "M": "modified",
+    "T": "modified",
+    "U": "modified",
+}
+
+# Porcelain v2 entry kind -> number of splits before the path field
+_PORCELAIN_SPLITS = {"1": 8, "2": 9, "u": 10}
+
+
+def _parse_porcelain_v2(buf: bytes) -> list[FileChange]:
+    """Parse `git status --porcelain=v2 -z` output into FileChange objects.
+    
+    The index (staged) status of a file wins over its worktree status, and
+    each path is reported once.
+    """
+    changes: dict[str, FileChange] = {}
+    tokens = buf.split(b"\0")
+    i = 0
+    while i < len(tokens):
+        entry = tokens[i].decode("utf-8", errors="replace")
+        i += 1
+        kind = entry[:1]
+        
+        if kind == "?":
+            path, status = entry[2:], "added"
+        elif kind in _PORCELAIN_SPLITS:
+            # 1: XY sub mH mI mW hH hI path
+            # 2: XY sub mH mI mW hH hI Xscore path, then origPath as its own token
+            # u: XY sub m1 m2 m3 mW h1 h2 h3 path
+            fields = entry.split(" ", _PORCELAIN_SPLITS[kind])
+            xy = fields[1]
+            code = xy[0] if xy[0] != "." else xy[1]
+            path = fields[-1]
+            status = _PORCELAIN_STATUS.get(code, "modified")
+            if kind == "2":
+                i += 1  # Skip origPath
+        else:
+            continue  # Headers, ignored entries, trailing empty token
+        
+        if path not in changes:
+            # Trusted values from git; skip pydantic validation
+            changes[path] = FileChange.model_construct(path=path, status=status)
+    
+    return list(changes.values())
 
 
 def get_uncommitted_files(repo: Repo) -> list[FileChange]:
     """Get list of all uncommitted file changes (staged + unstaged + untracked).
     
+    Uses a single `git status --porcelain=v2 -z` call; works in fresh
+    repositories without commits as well.
+    
     Args:
         repo: The git Repo object.
     
     Returns:
         List of FileChange objects representing all uncommitted changes.
-    """
-    changes: list[FileChange] = []
     
-    # Check if repo has any commits
-    has_commits = False
+    Raises:
+        GitError: If git status fails.
+    """
     try:
-        repo.head.commit
-        has_commits = True
-    except ValueError:
-        # Fresh repo with no commits
-        pass
-    
-    if has_commits:
-        # Get staged changes (in index, not yet committed)
-        try:
-            staged_diffs = repo.index.diff(repo.head.commit)
-            for diff in staged_diffs:
-                status = _get_diff_status(diff)
-                path = diff.b_path or diff.a_path
-                changes.append(FileChange(path=path, status=status))
-        except Exception:
-            pass
-        
-        # Get unstaged changes (modified but not staged)
-        try:
-            unstaged_diffs = repo.index.diff(None)
-            for diff in unstaged_diffs:
-                status = _get_diff_status(diff)
-                path = diff.b_path or diff.a_path
-                # Avoid duplicates if file is both staged and has more unstaged changes
-                if not any(c.path == path for c in changes):
-                    changes.append(FileChange(path=path, status=status))
-        except Exception:
-            pass
-    
-    # Get untracked files (new files not yet added) - works even in fresh repos
-    for untracked in repo.untracked_files:
-        if not any(c.path == untracked for c in changes):
-            changes.append(FileChange(path=untracked, status="added"))
+        output = repo.git.execute(
+            _git_command("status", "--porcelain=v2", "-z", "--untracked-files=all"),
+            stdout_as_string=False,
+        )
+    except GitCommandError as e:
+        raise GitError(f"Failed to get status: {e}")
     
+    changes = _parse_porcelain_v2(output)
+    for change in changes:
+        change._repo = repo  # Lets change.diff be fetched on demand
     return changes
 
 
-def _get_diff_status(diff) -> str:
-    """Convert a git diff type to a human-readable status string."""
-    if diff.new_file:
-        return "added"
-    elif diff.deleted_file:
-        return "deleted"
-    elif diff.renamed_file:
-        return "renamed"
-    else:
-        return "modified"
+def _iter_git_output(repo: Repo, args: list[str], chunk_size: int) -> Iterator[bytes]:
+    """Yield a git command's stdout in chunks as it is produced.
+    
+    Closing the iterator early kills the process, so output that is not
+    consumed is never produced or buffered. Stderr is drained on a background
+    thread, so git never blocks on a full stderr pipe while stdout is read.
+    
+    Raises:
+        GitError: If the command exits with a non-zero status (the message
+            includes git's stderr).
+    """
+    command = _git_command(*args)
+    proc = repo.git.execute(command, as_process=True)
+    stderr_chunks: list[bytes] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.extend(iter(lambda: proc.stderr.read1(65536), b"")),
+        daemon=True,
+    )
+    stderr_reader.start()
+    finished = False
+    try:
+        while chunk := proc.stdout.read1(chunk_size):
+            yield chunk
+        finished = True
+    finally:
+        proc.stdout.close()
+        if not finished:
+            proc.proc.kill()
+        status = proc.proc.wait()
+        stderr_reader.join()
+        proc.stderr.close()
+    
+    if status != 0:
+        raise GitError(str(GitCommandError(command, status, b"".join(stderr_chunks))))
 
 
-def get_diff(repo: Repo, file_path: str | None = None) -> str:
+def _new_file_diff(repo: Repo, file_path: str, max_bytes: int | None = None) -> bytes | None:
+    """Build the diff git shows for an untracked file, without running git.
+    
+    Produces the same "new file" patch as `git diff --no-index /dev/null
+    <file>` (minus the index line), including git's binary-file notice and
+    its no-newline marker.
+    
+    Args:
+        repo: The git Repo object.
+        file_path: Path to the file relative to repo root.
+        max_bytes: Optional limit on how much of the file is read. A longer
+            file gets a hunk covering only the lines read, followed by a
+            "... [truncated]" marker. The diff (header included) then exceeds
+            max_bytes, so callers cutting at that size mark it truncated too.
+    
+    Returns:
+        The diff bytes, or None if the path is not a readable regular file.
+    """
+    full_path = get_repo_root(repo) / file_path
+    try:
+        st = os.stat(full_path)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        with open(full_path, "rb") as f:
+            # Probe for binary content before reading any further
+            data = f.read(BINARY_CHECK_BYTES)
+            binary = b"\0" in data
+            truncated = False
+            if not binary:
+                if max_bytes is None:
+                    data += f.read()
+                elif len(data) < max_bytes:
+                    data += f.read(max_bytes - len(data))
+                    truncated = f.read(1) != b""
+                else:
+                    truncated = len(data) > max_bytes or f.read(1) != b""
+                    data = data[:max_bytes]
+    except OSError:
+        return None
+    
+    mode = "100755" if st.st_mode & 0o111 else "100644"
+    header = f"diff --git a/{file_path} b/{file_path}\nnew file mode {mode}\n".encode()
+    if not data:
+        return header
+    if binary:
+        return header + f"Binary files /dev/null and b/{file_path} differ\n".encode()
+    
+    lines = data.split(b"\n")
+    has_final_newline = lines[-1] == b""
+    if has_final_newline:
+        lines.pop()
+    count = "1" if len(lines) == 1 else f"1,{len(lines)}"
+    
+    parts = [header, f"--- /dev/null\n+++ b/{file_path}\n@@ -0,0 +{count} @@\n".encode()]
+    parts.extend(b"+" + line + b"\n" for line in lines)
+    if truncated:
+        parts.append(b"... [truncated]\n")
+    elif not has_final_newline:
+        parts.append(b"\\ No newline at end of file\n")
+    return b"".join(parts)
+
+
+def iter_diff(
+    repo: Repo,
+    file_path: str | None = None,
+    chunk_size: int = DIFF_CHUNK_BYTES,
+    max_bytes: int | None = None,
+) -> Iterator[bytes]:
+    """Stream the diff for a specific file or all uncommitted changes.
+    
+    Args:
+        repo: The git Repo object.
+        file_path: Optional path to a specific file. If None, streams the diff for all files.
+        chunk_size: Maximum size of each yielded chunk.
+        max_bytes: Optional limit on how much of an untracked file is read
+            (see _new_file_diff); git's own output is streamed as is.
+    
+    Yields:
+        Raw diff output in chunks, as git produces it.
+    
+    Raises:
+        GitError: If git diff fails.
+    """
+    if file_path is None:
+        yield from _iter_git_output(repo, ["diff", "HEAD"], chunk_size)
+        return
+    
+    # Diff for specific file (both staged and unstaged)
+    produced = False
+    for chunk in _iter_git_output(repo, ["diff", "HEAD", "--", file_path], chunk_size):
+        produced = True
+        yield chunk
+    
+    if not produced:
+        # Untracked file: build the diff in Python instead of spawning
+        # `git diff --no-index /dev/null` (which also needs a POSIX /dev/null)
+        diff = _new_file_diff(repo, file_path, max_bytes)
+        if diff:
+            yield diff
+
+
+def get_diff(repo: Repo, file_path: str | None = None, max_bytes: int | None = None) -> str:
     """Get the diff for a specific file or all uncommitted changes.
     
     Args:
         repo: The git Repo object.
         file_path: Optional path to a specific file. If None, returns diff for all files.
+        max_bytes: Optional limit on the diff size. Output past the limit is
+            never read; the diff is cut and marked "... [truncated]".
     
     Returns:
         The diff content as a string.
@@ -122,27 +347,300 @@ def get_diff(repo: Repo, file_path: str | None = None) -> str:
     Raises:
         GitError: If there's an error getting the diff.
     """
+    limit = max_bytes if max_bytes is not None else -1
+    chunk_size = DIFF_CHUNK_BYTES if limit < 0 else min(DIFF_CHUNK_BYTES, limit + 1)
+    
+    data = bytearray()
+    chunks = iter_diff(repo, file_path, chunk_size, max_bytes)
     try:
-        if file_path:
-            # Get diff for specific file (both staged and unstaged)
-            diff = repo.git.diff("HEAD", "--", file_path)
-            if not diff:
-                # Try getting diff for untracked file
-                diff = repo.git.diff("--no-index", "/dev/null", file_path, with_exceptions=False)
-            return diff
-        else:
-            # Get diff for all changes
-            return repo.git.diff("HEAD")
-    except GitCommandError as e:
+        for chunk in chunks:
+            data += chunk
+            if 0 <= limit < len(data):
+                break
+    except GitError as e:
         raise GitError(f"Failed to get diff: {e}")
+    finally:
+        chunks.close()
+    
+    truncated = 0 <= limit < len(data)
+    text = bytes(data[:limit] if truncated else data).decode("utf-8", errors="replace")
+    text = text.removesuffix("\n")
+    if truncated:
+        text += "\n... [truncated]"
+    return text
+
+
+def _unquote_c(data: bytes) -> bytes | None:
+    """Decode the C-quoted string at the start of data (e.g. b'"a/q\\"x"').
+    
+    Returns:
+        The unquoted bytes, or None if data does not start with a valid
+        quoted string.
+    """
+    if not data.startswith(b'"'):
+        return None
+    out = bytearray()
+    i = 1
+    while i < len(data):
+        c = data[i]
+        if c == 0x22:  # Closing quote
+            return bytes(out)
+        if c != 0x5C:
+            out.append(c)
+            i += 1
+            continue
+        
+        esc = data[i + 1:i + 2]
+        if esc and esc in b"01234567":
+            out.append(int(data[i + 1:i + 4], 8) & 0xFF)
+            i += 4
+        elif esc in _C_ESCAPES:
+            out.append(_C_ESCAPES[esc])
+            i += 2
+        else:
+            return None
+    return None
+
+
+def _parse_diff_header(line: bytes) -> str | None:
+    """Return the path named by a `diff --git` header line, or None."""
+    rest = line[len(b"diff --git "):]
+    if rest.startswith(b'"'):
+        # Paths with quotes, backslashes or control characters are C-quoted
+        # even with core.quotePath=false
+        path = _unquote_c(rest)
+    else:
+        match = _PLAIN_HEADER_RE.fullmatch(rest)
+        path = b"a/" + match.group(1) if match else None
+    
+    if path is None or not path.startswith(b"a/"):
+        return None
+    return path[2:].decode("utf-8", errors="replace")
+
+
+def _untracked_paths(repo: Repo, file_paths: list[str]) -> set[str]:
+    """Return which of the given paths are untracked (`?` in git status)."""
+    try:
+        output = repo.git.execute(
+            _git_command("ls-files", "-z", "--others", "--exclude-standard", "--",
+                         *file_paths),
+            stdout_as_string=False,
+        )
+    except GitCommandError:
+        return set()
+    return {path.decode("utf-8", errors="replace") for path in output.split(b"\0") if path}
+
+
+def get_diffs_batch(repo: Repo, file_paths: list[str]) -> dict[str, str]:
+    """Get diffs for many files with a single git invocation.
+    
+    Runs one `git diff HEAD` over all paths and splits the output per file.
+    Untracked files get their diff built in Python. Tracked files missing
+    from the batch output (e.g. an unparseable header), or every file if the
+    batch itself fails, fall back to get_diff(), run concurrently. Files
+    whose diff still can't be produced are left out.
+    
+    Args:
+        repo: The git Repo object.
+        file_paths: Paths relative to repo root.
+    
+    Returns:
+        Mapping of file path to its diff.
+    """
+    diffs: dict[str, str] = {}
+    if not file_paths:
+        return diffs
+    
+    batch_ok = True
+    try:
+        # Keep stdout as bytes so only the per-file sections get decoded, and
+        # leave non-ASCII paths unquoted so headers match the requested paths
+        output = repo.git.execute(
+            _git_command("-c", "core.quotePath=false", "diff", "--no-color", "--no-renames",
+                         "HEAD", "--", *file_paths),
+            stdout_as_string=False,
+        )
+    except GitCommandError:
+        output = b""
+        batch_ok = False
+    
+    starts = [match.start() for match in _DIFF_SECTION_RE.finditer(output)]
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else len(output)
+        section = output[start:end].rstrip(b"\n")
+        path = _parse_diff_header(section.partition(b"\n")[0])
+        if path is not None:
+            diffs[path] = section.decode("utf-8", errors="replace")
+    
+    missing = [path for path in file_paths if path not in diffs]
+    
+    # Untracked files have no diff against HEAD; build those diffs directly
+    if batch_ok and missing:
+        untracked = _untracked_paths(repo, missing)
+        for path in missing:
+            if path not in untracked:
+                continue
+            raw = _new_file_diff(repo, path, MAX_DIFF_BYTES)
+            if raw is None:
+                continue
+            text = raw[:MAX_DIFF_BYTES].decode("utf-8", errors="replace").rstrip("\n")
+            if len(raw) > MAX_DIFF_BYTES:
+                text += "\n... [truncated]"
+            diffs[path] = text
+        missing = [path for path in missing if path not in untracked]
+    
+    # Otherwise fall back to per-file git calls, run concurrently
+    if missing:
+        def fallback(path: str) -> str | None:
+            try:
+                return get_diff(repo, path, max_bytes=MAX_DIFF_BYTES)
+            except GitError:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_DIFF_WORKERS, len(missing))) as pool:
+            for path, diff in zip(missing, pool.map(fallback, missing)):
+                if diff is not None:
+                    diffs[path] = diff
+    
+    return diffs
 
 
-def get_file_content(repo: Repo, file_path: str) -> str:
-    """Read the current content of a file.
+def get_changes_fingerprint(repo: Repo, changes: list[FileChange]) -> str:
+    """Compute a fingerprint identifying the exact state of a changeset.
+    
+    The fingerprint covers each file's path, status and worktree blob hash,
+    so it changes whenever any uncommitted file is edited, added or removed.
+    
+    Args:
+        repo: The git Repo object.
+        changes: Uncommitted changes as returned by get_uncommitted_files.
+    
+    Returns:
+        Hex SHA-256 digest of the changeset.
+    
+    Raises:
+        GitError: If hashing the worktree files fails.
+    """
+    repo_root = get_repo_root(repo)
+    existing = [c.path for c in changes if (repo_root / c.path).is_file()]
+    
+    blob_shas: dict[str, str] = {}
+    if existing:
+        try:
+            # One hash-object call for every file still present in the worktree
+            output = repo.git.hash_object("--", *existing)
+        except GitCommandError as e:
+            raise GitError(f"Failed to hash files: {e}")
+        blob_shas = dict(zip(existing, output.splitlines()))
+    
+    digest = hashlib.sha256()
+    for c in sorted(changes, key=lambda c: c.path):
+        digest.update(f"{c.path}:{c.status}:{blob_shas.get(c.path, '-')}\n".encode())
+    return digest.hexdigest()
+
+
+class BatchReader:
+    """Read objects through one long-lived `git cat-file --batch` process.
+    
+    Each read() costs a line of I/O instead of a new git process:
+    
+        with BatchReader(repo) as reader:
+            old = reader.read("HEAD:src/app.py")
+            older = reader.read("HEAD~1:src/app.py")
+    """
+    
+    def __init__(self, repo: Repo):
+        self._repo = repo
+        self._proc: Git.AutoInterrupt | None = None
+    
+    def __enter__(self) -> BatchReader:
+        self._proc = self._repo.git.execute(
+            _git_command("cat-file", "--batch"), istream=subprocess.PIPE, as_process=True
+        )
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.stdout.close()
+            try:
+                self._proc.wait()
+            except GitCommandError:
+                pass  # Every read already succeeded or raised
+            finally:
+                self._proc.stderr.close()
+            self._proc = None
+    
+    def read(self, object_name: str) -> bytes:
+        """Read an object's content, e.g. "HEAD:path/to/file".
+        
+        Raises:
+            GitError: If the object does not exist or the reader is not open.
+        """
+        if self._proc is None:
+            raise GitError("BatchReader is not open")
+        if "\n" in object_name:
+            raise GitError(f"Invalid object name: {object_name!r}")
+        
+        try:
+            self._proc.stdin.write(object_name.encode() + b"\n")
+            self._proc.stdin.flush()
+        except OSError:
+            error = self._proc.stderr.read().decode("utf-8", errors="replace").strip()
+            raise GitError(f"git cat-file --batch exited: {error}")
+        
+        # Header is "<sha> <type> <size>", or "<name> missing"/"<name> ambiguous";
+        # names may contain spaces, so check the last token before splitting
+        header = self._proc.stdout.readline().rstrip(b"\n")
+        if header.endswith((b" missing", b" ambiguous")):
+            raise GitError(f"Object not found: {object_name}")
+        fields = header.rsplit(b" ", 2)
+        try:
+            size = int(fields[2])
+        except (IndexError, ValueError):
+            raise GitError(f"Unexpected cat-file header for {object_name}: {header!r}")
+        data = self._proc.stdout.read(size)
+        self._proc.stdout.read(1)  # Trailing newline after the content
+        return data
+
+
+def _decode_file(data: bytes, file_path: str, truncated: bool) -> str:
+    """Decode file bytes as UTF-8, appending a marker if they were cut short.
+    
+    Raises:
+        GitError: If the file is binary.
+    """
+    if b"\0" in data[:BINARY_CHECK_BYTES]:
+        raise GitError(f"Cannot read binary file: {file_path}")
+    if truncated:
+        # The cut may split a multi-byte character
+        return data.decode("utf-8", errors="replace") + "\n... [truncated]"
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        raise GitError(f"Cannot read binary file: {file_path}")
+
+
+def get_file_content(
+    repo: Repo,
+    file_path: str,
+    max_bytes: int | None = MAX_FILE_BYTES,
+    ref: str | None = None,
+    reader: BatchReader | None = None,
+) -> str:
+    """Read the content of a file, from the working tree or a git revision.
+    
+    Files larger than max_bytes are not loaded fully: only the first
+    max_bytes bytes are kept and a truncation marker is appended.
     
     Args:
         repo: The git Repo object.
         file_path: Path to the file relative to repo root.
+        max_bytes: Maximum number of bytes to read, or None for no limit.
+        ref: Revision to read the file from (e.g. "HEAD"); None reads the
+            working tree.
+        reader: Open BatchReader to use for ref reads; pass one when reading
+            many files so they share a single git process.
     
     Returns:
         The file content as a string.
@@ -150,20 +648,66 @@ def get_file_content(repo: Repo, file_path: str) -> str:
     Raises:
         GitError: If the file cannot be read.
     """
+    if ref is not None:
+        object_name = f"{ref}:{file_path}"
+        try:
+            if reader is None:
+                with BatchReader(repo) as own_reader:
+                    data = own_reader.read(object_name)
+            else:
+                data = reader.read(object_name)
+        except GitError:
+            raise GitError(f"File not found: {file_path} at {ref}")
+        
+        truncated = max_bytes is not None and len(data) > max_bytes
+        return _decode_file(data[:max_bytes] if truncated else data, file_path, truncated)
+    
     repo_root = get_repo_root(repo)
     full_path = repo_root / file_path
     
     try:
-        with open(full_path, "r", encoding="utf-8") as f:
-            return f.read()
+        size = os.stat(full_path).st_size
+        if max_bytes is not None and size > max_bytes:
+            with open(full_path, "rb") as f:
+                return _decode_file(f.read(max_bytes), file_path, truncated=True)
+        
+        # One bulk read and decode instead of a text-mode incremental decoder
+        return _decode_file(full_path.read_bytes(), file_path, truncated=False)
     except FileNotFoundError:
         raise GitError(f"File not found: {file_path}")
-    except UnicodeDecodeError:
-        raise GitError(f"Cannot read binary file: {file_path}")
+    except GitError:
+        raise
     except Exception as e:
         raise GitError(f"Failed to read file {file_path}: {e}")
 
 
+# git log format for CommitInfo: full hash, author, committer date, raw message
+# (records are NUL-separated with -z, since messages span several lines)
+_LOG_FORMAT = "--pretty=format:%H%x1f%an%x1f%cI%x1f%B"
+
+
+def _log_commits(repo: Repo, n: int) -> list[CommitInfo]:
+    """Read the last n commits with one `git log` call (empty if there are none)."""
+    try:
+        output = repo.git.log("-z", f"-n{n}", _LOG_FORMAT)
+    except GitCommandError:
+        # Repository might be empty or have no commits
+        return []
+    
+    commits: list[CommitInfo] = []
+    for record in output.split("\0"):
+        if not record:
+            continue
+        sha, author, date, message = record.split("\x1f", 3)
+        # First line of the message only; %s would join a wrapped first paragraph
+        subject = message.strip().partition("\n")[0]
+        # Fields come straight from git as strings; skip pydantic validation
+        commits.append(CommitInfo.model_construct(
+            hash=sha[:7], message=subject, author=author, date=date,
+        ))
+    return commits
+
+
 def get_recent_commits(repo: Repo, n: int = 10) -> list[CommitInfo]:
     """Get recent commit history for style matching.
     
@@ -174,62 +718,102 @@ def get_recent_commits(repo: Repo, n: int = 10) -> list[CommitInfo]:
     Returns:
         List of CommitInfo objects.
     """
-    commits: list[CommitInfo] = []
-    
-    try:
-        for commit in repo.iter_commits(max_count=n):
-            commits.append(CommitInfo(
-                hash=commit.hexsha[:7],
-                message=commit.message.strip().split("\n")[0],  # First line only
-                author=commit.author.name,
-                date=commit.committed_datetime.isoformat(),
-            ))
-    except Exception:
-        # Repository might be empty or have no commits
-        pass
-    
-    return commits
+    return _log_commits(repo, n)
 
 
-def get_directory_structure(repo: Repo, max_depth: int = 3) -> str:
+def _get_ignored_paths(repo: Repo) -> frozenset[str]:
+    """Get paths ignored by .gitignore and friends (ignored directories as a whole).
+    
+    Returns:
+        Repo-relative paths without trailing slashes; empty if git fails.
+    """
+    try:
+        output = repo.git.execute(
+            _git_command("ls-files", "--others", "--ignored", "--exclude-standard",
+                         "--directory", "-z"),
+            stdout_as_string=False,
+        )
+    except GitCommandError:
+        return frozenset()
+    return frozenset(
+        p.decode("utf-8", errors="replace").rstrip("/") for p in output.split(b"\0") if p
+    )
+
+
+def get_directory_structure(
+    repo: Repo,
+    max_depth: int = 3,
+    max_entries_per_dir: int = 50,
+    skip_dirs: frozenset[str] = STRUCTURE_SKIP_DIRS,
+    max_total_entries: int = 1000,
+) -> str:
     """Get a tree representation of the project structure.
     
+    Files and directories ignored by git are left out. Output is bounded:
+    directories deeper than max_depth are not expanded, each directory lists
+    at most max_entries_per_dir entries (followed by a "... (+N more)"
+    marker when truncated), and the whole tree stops after
+    max_total_entries lines.
+    
     Args:
         repo: The git Repo object.
         max_depth: Maximum depth to traverse.
+        max_entries_per_dir: Maximum entries listed per directory.
+        skip_dirs: Directory names to leave out entirely.
+        max_total_entries: Maximum entries listed in total.
     
     Returns:
         A string representation of the directory tree.
     """
     repo_root = get_repo_root(repo)
+    ignored = _get_ignored_paths(repo)
     lines: list[str] = []
+    truncated = False
     
-    def _walk(path: Path, prefix: str, depth: int):
-        if depth > max_depth:
+    def _walk(path: str | Path, rel_dir: str, prefix: str, depth: int):
+        nonlocal truncated
+        if depth > max_depth or truncated:
             return
         
-        # Skip hidden directories and common non-essential directories
-        skip_dirs = {".git", "__pycache__", "node_modules", ".venv", "venv", ".tox", ".pytest_cache"}
-        
+        # One scandir pass: DirEntry.is_dir() comes from the directory listing,
+        # and hidden/non-essential entries are dropped before sorting
         try:
-            entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
-        except PermissionError:
+            with os.scandir(path) as it:
+                entries = [
+                    (not e.is_dir(), e.name.lower(), e.name, e.path)
+                    for e in it
+                    if e.name not in skip_dirs and not e.name.startswith(".")
+                    and rel_dir + e.name not in ignored
+                ]
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
             return
+        entries.sort()
         
-        # Filter entries
-        entries = [e for e in entries if e.name not in skip_dirs and not e.name.startswith(".")]
+        # Cap the listing so huge directories don't blow up the output
+        hidden = len(entries) - max_entries_per_dir
+        if hidden > 0:
+            entries = entries[:max_entries_per_dir]
         
-        for i, entry in enumerate(entries):
-            is_last = i == len(entries) - 1
+        for i, (is_file, _, name, entry_path) in enumerate(entries):
+            if len(lines) > max_total_entries:
+                truncated = True
+                return
+            is_last = i == len(entries) - 1 and hidden <= 0
             connector = "└── " if is_last else "├── "
-            lines.append(f"{prefix}{connector}{entry.name}")
+            lines.append(f"{prefix}{connector}{name}")
             
-            if entry.is_dir():
+            if not is_file:
                 extension = "    " if is_last else "│   "
-                _walk(entry, prefix + extension, depth + 1)
+                _walk(entry_path, f"{rel_dir}{name}/", prefix + extension, depth + 1)
+        
+        if hidden > 0:
+            lines.append(f"{prefix}└── ... (+{hidden} more)")
     
     lines.append(repo_root.name + "/")
-    _walk(repo_root, "", 1)
+    _walk(repo_root, "", "", 1)
+    
+    if truncated:
+        lines.append(f"... (stopped after {max_total_entries} entries)")
     
     return "\n".join(lines)
 
@@ -251,6 +835,32 @@ def stage_files(repo: Repo, file_paths: list[str]) -> None:
         raise GitError(f"Failed to stage files: {e}")
 
 
+def reset_and_stage(repo: Repo, file_paths: list[str]) -> None:
+    """Make the index hold exactly the given files' working tree changes.
+    
+    Equivalent to unstage_all() followed by stage_files(), done with a plain
+    `git reset` and a single `git add` instead of rewriting the index in Python.
+    
+    Args:
+        repo: The git Repo object.
+        file_paths: List of file paths to stage.
+    
+    Raises:
+        GitError: If staging fails.
+    """
+    try:
+        repo.git.reset("-q")
+        repo.git.add("--", *file_paths)
+    except Exception as e:
+        raise GitError(f"Failed to stage files: {e}")
+    finally:
+        invalidate_repo_cache()
+
+
+# First line of `git commit` output, e.g. "[main (root-commit) abc1234] msg"
+_COMMIT_SUMMARY_RE = re.compile(r"^\[[^\]]* ([0-9a-f]{7,})\]")
+
+
 def create_commit(repo: Repo, message: str) -> str:
     """Create a commit with the staged changes.
     
@@ -266,10 +876,13 @@ def create_commit(repo: Repo, message: str) -> str:
     """
     try:
         # Use git commit command directly (handles initial commits better)
-        repo.git.commit("-m", message)
-        # Get the hash of the commit we just made
-        commit_hash = repo.git.rev_parse("HEAD", short=7)
-        return commit_hash
+        output = repo.git.commit("-m", message)
+        invalidate_repo_cache()
+        # The summary line ("[main abc1234] msg") already names the new commit
+        match = _COMMIT_SUMMARY_RE.match(output)
+        if match:
+            return match.group(1)
+        return repo.git.rev_parse("HEAD", short=7)
     except Exception as e:
         raise GitError(f"Failed to create commit: {e}")
 
@@ -285,6 +898,7 @@ def unstage_all(repo: Repo) -> None:
     except Exception:
         # Ignore errors, repo might be in an unusual state
         pass
+    invalidate_repo_cache()
 
 
 def get_last_commit(repo: Repo) -> CommitInfo | None:
@@ -296,24 +910,20 @@ def get_last_commit(repo: Repo) -> CommitInfo | None:
     Returns:
         CommitInfo for the last commit, or None if no commits exist.
     """
-    try:
-        commit = repo.head.commit
-        return CommitInfo(
-            hash=commit.hexsha[:7],
-            message=commit.message.strip().split("\n")[0],
-            author=commit.author.name,
-            date=commit.committed_datetime.isoformat(),
-        )
-    except (ValueError, TypeError):
-        return None
+    commits = _log_commits(repo, 1)
+    return commits[0] if commits else None
 
 
-def undo_last_commit(repo: Repo, mode: str = "mixed") -> CommitInfo:
+def undo_last_commit(
+    repo: Repo, mode: str = "mixed", last_commit: CommitInfo | None = None
+) -> CommitInfo:
     """Undo the last commit.
     
     Args:
         repo: The git Repo object.
         mode: Reset mode - "soft" (keep staged), "mixed" (keep unstaged), "hard" (discard).
+        last_commit: The HEAD commit, if the caller already looked it up;
+            saves a second `git log` call.
     
     Returns:
         CommitInfo of the undone commit.
@@ -321,7 +931,8 @@ def undo_last_commit(repo: Repo, mode: str = "mixed") -> CommitInfo:
     Raises:
         GitError: If there's no commit to undo or the operation fails.
     """
-    last_commit = get_last_commit(repo)
+    if last_commit is None:
+        last_commit = get_last_commit(repo)
     if last_commit is None:
         raise GitError("No commits to undo")
     
@@ -335,6 +946,7 @@ def undo_last_commit(repo: Repo, mode: str = "mixed") -> CommitInfo:
         else:
             # Mixed reset (default): undo commit, keep changes unstaged
             repo.git.reset("HEAD~1")
+        invalidate_repo_cache()
         return last_commit
     except Exception as e:
         raise GitError(f"Failed to undo commit: {e}")
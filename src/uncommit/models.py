@@ -1,19 +1,37 @@
 """Data models for uncommit."""
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class FileChange(BaseModel):
     """Represents a single file change in the working directory."""
 
+    model_config = ConfigDict(frozen=True)
+
     path: str = Field(description="Path to the file relative to repo root")
     status: str = Field(description="Change status: added, modified, deleted, renamed")
-    diff: str | None = Field(default=None, description="The diff content for this file")
+
+    # Repo the change belongs to and the diff, computed on first access
+    _repo: Any = PrivateAttr(default=None)
+    _diff: str | None = PrivateAttr(default=None)
+
+    @property
+    def diff(self) -> str | None:
+        """The diff content for this file, fetched lazily (None without a repo)."""
+        if self._diff is None and self._repo is not None:
+            from uncommit.git_ops import get_diff
+
+            self._diff = get_diff(self._repo, self.path)
+        return self._diff
 
 
 class CommitInfo(BaseModel):
     """Represents a commit from git history."""
 
+    model_config = ConfigDict(frozen=True)
+
     hash: str = Field(description="Short commit hash")
     message: str = Field(description="Commit message")
     author: str = Field(description="Author name")
@@ -35,3 +53,5 @@ class SuggestionResult(BaseModel):
 
     groups: list[CommitGroup] = Field(description="Proposed commit groups")
     warnings: list[str] | None = Field(default=None, description="Optional warnings about potential issues")
+    fingerprint: str | None = Field(default=None, description="Fingerprint of the changeset these groups were made for")
+    model: str | None = Field(default=None, description="Model that proposed these groups (None if no model was used)")
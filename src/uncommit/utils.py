@@ -1,5 +1,12 @@
 """Utility functions for uncommit."""
 
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install uncommit[speedups])
+    orjson = None
+
 
 def format_file_size(bytes: int) -> str:
     """Format bytes as human-readable file size."""
@@ -15,3 +22,88 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     if len(text) <= max_length:
         return text
     return text[: max_length - 3] + "..."
+
+
+def dumps_json(obj, indent: bool = False) -> str:
+    """Serialize an object to JSON text, using orjson when it is installed.
+
+    The stdlib fallback is configured to match orjson's output byte for byte
+    (compact separators, raw UTF-8), so output doesn't depend on the backend.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def loads_json(data: str | bytes):
+    """Parse JSON text, using orjson when it is installed.
+
+    Both backends raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JsonObjectScanner:
+    """Incrementally find the first complete top-level JSON object in streamed text.
+
+    Text before the opening brace is ignored; braces inside JSON strings
+    (including escaped quotes) do not affect nesting depth.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._result: str | None = None
+
+    def feed(self, text: str) -> str | None:
+        """Add more text; return the object once its closing brace arrives."""
+        self._buf += text
+        if self._result is not None:
+            return self._result
+        buf = self._buf
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._start < 0:
+                if ch == "{":
+                    self._start = i
+                    self._depth = 1
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._result = buf[self._start : i + 1]
+                    return self._result
+        self._pos = len(buf)
+        return None
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._buf
+
+
+def extract_json_object(text: str) -> str | None:
+    """Return the first complete top-level JSON object in text, or None."""
+    return JsonObjectScanner().feed(text)
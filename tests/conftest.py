@@ -0,0 +1,52 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+
+def _init_repo(path: Path) -> Repo:
+    """Create a git repository with a test user configured for commits."""
+    repo = Repo.init(path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+    return repo
+
+
+@pytest.fixture
+def temp_repo(tmp_path):
+    """Create a temporary git repository for testing."""
+    repo = _init_repo(tmp_path)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture(scope="module")
+def shared_repo(tmp_path_factory):
+    """Create one repo with an initial commit for the whole module."""
+    path = tmp_path_factory.mktemp("repo")
+    repo = _init_repo(path)
+    
+    (path / "initial.txt").write_text("initial content")
+    repo.index.add(["initial.txt"])
+    repo.index.commit("Initial commit")
+    repo.create_tag("initial")
+    
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def repo_with_commit(shared_repo):
+    """Restore the shared repo to its initial commit with a clean worktree."""
+    shared_repo.git.reset("--hard", "initial")
+    shared_repo.git.clean("-fdx")
+    return shared_repo
+
+
+@pytest.fixture
+def repo_dir(repo_with_commit):
+    """Working directory of repo_with_commit."""
+    return Path(repo_with_commit.working_dir)
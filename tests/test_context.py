@@ -0,0 +1,156 @@
+"""Unit tests for context module."""
+
+import asyncio
+
+import pytest
+
+from uncommit import agent, context
+from uncommit.context import (
+    clear_area_cache,
+    generate_area_docs_bulk,
+    get_area_hash,
+    get_areas_dir,
+    load_area_doc,
+    load_area_doc_if_fresh,
+    save_area_doc,
+)
+
+
+@pytest.fixture
+def area_repo(repo_with_commit, repo_dir, monkeypatch):
+    """Run the test from inside the shared repo with fresh area caches."""
+    monkeypatch.chdir(repo_dir)
+    clear_area_cache()
+    return repo_dir
+
+
+class FakeClient:
+    """Stand-in for genai.Client that records prompts and replays canned text."""
+
+    def __init__(self, bulk_text):
+        self.bulk_text = bulk_text
+        self.prompts = []
+        self.aio = self
+        self.models = self
+
+    async def generate_content(self, model, contents):
+        self.prompts.append(contents)
+
+        class Response:
+            text = self.bulk_text
+
+        if "=== AREA:" not in contents:
+            # Per-area request: answer with a doc naming the area
+            area = contents.split("## Area: ", 1)[1].split("\n", 1)[0]
+            Response.text = f"single doc for {area}"
+        return Response()
+
+
+def _write_doc(area, header, body="body"):
+    (get_areas_dir() / f"{area}.md").write_text(f"{header}\n{body}", encoding="utf-8")
+
+
+class TestLoadAreaDocIfFresh:
+    """Tests for load_area_doc_if_fresh function."""
+
+    def test_mtime_fast_path(self, area_repo, monkeypatch):
+        """Should trust a matching root mtime without hashing the area."""
+        save_area_doc("root", "body", get_area_hash("root"))
+
+        def fail(area):
+            raise AssertionError("get_area_hash should not be called")
+
+        monkeypatch.setattr(context, "get_area_hash", fail)
+        assert load_area_doc_if_fresh("root") == "body"
+
+        # The header is parsed by field, not by fixed offsets
+        _write_doc("root", f"<!-- hash:abc mtime:{context._area_mtime('root')} -->")
+        assert load_area_doc_if_fresh("root") == "body"
+
+    def test_changed_mtime_checks_hash(self, area_repo, monkeypatch):
+        """Should fall back to the hash when the stored mtime differs."""
+        current = get_area_hash("root")
+        _write_doc("root", f"<!-- hash:{current} mtime:1 -->")
+
+        calls = []
+        monkeypatch.setattr(context, "get_area_hash", lambda area: calls.append(area) or current)
+        assert load_area_doc_if_fresh("root") == "body"
+        assert calls == ["root"]
+
+        monkeypatch.setattr(context, "get_area_hash", lambda area: "other")
+        assert load_area_doc_if_fresh("root") is None
+
+    def test_header_without_mtime(self, area_repo):
+        """Should still validate docs written before the mtime field existed."""
+        _write_doc("root", f"<!-- hash:{get_area_hash('root')} -->")
+        assert load_area_doc_if_fresh("root") == "body"
+
+    def test_nested_area_ignores_mtime(self, area_repo, monkeypatch):
+        """Should always hash nested areas, even with a matching mtime field."""
+        (area_repo / "lib").mkdir()
+        (area_repo / "lib" / "a.py").write_text("a = 1\n")
+        root_mtime = context._area_mtime("root")
+        _write_doc("lib", f"<!-- hash:stale mtime:{root_mtime} -->")
+
+        assert load_area_doc_if_fresh("lib") is None
+
+    def test_malformed_header(self, area_repo):
+        """Should treat a doc without a valid header as stale."""
+        _write_doc("root", "<!-- hash: unterminated")
+        assert load_area_doc_if_fresh("root") is None
+
+
+class TestGenerateAreaDocsBulk:
+    """Tests for generate_area_docs_bulk function."""
+
+    AREAS = ["api", "lib", "web"]
+
+    @pytest.fixture
+    def areas(self, area_repo):
+        for area in self.AREAS:
+            (area_repo / area).mkdir()
+            (area_repo / area / "main.py").write_text(f"# {area}\n")
+        return list(self.AREAS)
+
+    def _run(self, monkeypatch, areas, bulk_text):
+        client = FakeClient(bulk_text)
+        monkeypatch.setattr(agent, "get_client", lambda api_key: client)
+        docs = asyncio.run(generate_area_docs_bulk(areas, "key"))
+        return docs, client
+
+    def test_complete_response(self, areas, monkeypatch):
+        """Should save every doc from one request."""
+        bulk = '{"areas": {"api": "api doc", "lib": "lib doc", "web": "web doc"}}'
+        docs, client = self._run(monkeypatch, areas, bulk)
+
+        assert docs == {"api": "api doc", "lib": "lib doc", "web": "web doc"}
+        assert len(client.prompts) == 1
+        for area in areas:
+            assert load_area_doc(area).startswith(f"<!-- hash:{get_area_hash(area)}")
+            assert load_area_doc_if_fresh(area) == docs[area]
+
+    def test_partial_response(self, areas, monkeypatch):
+        """Should generate only the areas missing from the response one by one."""
+        bulk = 'Here you go: {"areas": {"api": "api doc", "web": ""}}'
+        docs, client = self._run(monkeypatch, areas, bulk)
+
+        assert docs == {
+            "api": "api doc",
+            "lib": "single doc for lib",
+            "web": "single doc for web",
+        }
+        assert len(client.prompts) == 3
+
+    def test_invalid_json(self, areas, monkeypatch):
+        """Should generate every area one by one when the response can't be parsed."""
+        docs, client = self._run(monkeypatch, areas, '{"areas": {"api": ')
+
+        assert docs == {area: f"single doc for {area}" for area in areas}
+        assert len(client.prompts) == 1 + len(areas)
+
+    def test_no_areas(self, area_repo, monkeypatch):
+        """Should return nothing without calling the model."""
+        docs, client = self._run(monkeypatch, [], "{}")
+
+        assert docs == {}
+        assert client.prompts == []
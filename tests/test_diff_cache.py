@@ -0,0 +1,88 @@
+"""Unit tests for diff_cache module."""
+
+import os
+import time
+
+import pytest
+
+from uncommit import diff_cache
+from uncommit.diff_cache import (
+    DIFF_CACHE_TTL,
+    get_cached_diff,
+    get_cached_diffs,
+    clear_diff_cache,
+    get_diff_cache_dir,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(repo_with_commit):
+    """Start every test without cached diffs from earlier tests."""
+    clear_diff_cache(repo_with_commit)
+
+
+class TestGetCachedDiff:
+    """Tests for get_cached_diff function."""
+
+    def test_returns_diff(self, repo_with_commit, repo_dir):
+        """Should return the same diff as git."""
+        (repo_dir / "initial.txt").write_text("modified content")
+
+        diff = get_cached_diff(repo_with_commit, "initial.txt")
+        assert "+modified content" in diff
+
+    def test_writes_disk_cache(self, repo_with_commit, repo_dir):
+        """Should persist computed diffs to disk."""
+        (repo_dir / "initial.txt").write_text("modified content")
+
+        get_cached_diff(repo_with_commit, "initial.txt")
+        assert any(get_diff_cache_dir(repo_with_commit).iterdir())
+
+    def test_detects_file_change(self, repo_with_commit, repo_dir):
+        """Should recompute the diff when the file changes."""
+        target = repo_dir / "initial.txt"
+        target.write_text("first edit")
+        assert "+first edit" in get_cached_diff(repo_with_commit, "initial.txt")
+
+        target.write_text("second edit, longer")
+        assert "+second edit, longer" in get_cached_diff(repo_with_commit, "initial.txt")
+
+    def test_sweeps_expired_entries(self, repo_with_commit, repo_dir, monkeypatch):
+        """Should delete expired cache files when storing a new diff."""
+        cache_dir = get_diff_cache_dir(repo_with_commit)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        stale = cache_dir / "stale.diff"
+        stale.write_text("old diff")
+        old = time.time() - DIFF_CACHE_TTL - 1
+        os.utime(stale, (old, old))
+        monkeypatch.setattr(diff_cache, "_last_sweep", 0.0)
+
+        (repo_dir / "initial.txt").write_text("modified content")
+        get_cached_diff(repo_with_commit, "initial.txt")
+        assert not stale.exists()
+
+
+class TestGetCachedDiffs:
+    """Tests for get_cached_diffs function."""
+
+    def test_batch_and_cache_hit(self, repo_with_commit, repo_dir):
+        """Should return diffs for all files and reuse cached ones."""
+        (repo_dir / "initial.txt").write_text("modified content")
+        (repo_dir / "new.txt").write_text("new content")
+
+        diffs = get_cached_diffs(repo_with_commit, ["initial.txt", "new.txt"])
+        assert "+modified content" in diffs["initial.txt"]
+        assert "+new content" in diffs["new.txt"]
+        assert get_cached_diff(repo_with_commit, "new.txt") == diffs["new.txt"]
+
+
+class TestClearDiffCache:
+    """Tests for clear_diff_cache function."""
+
+    def test_removes_cache_dir(self, repo_with_commit, repo_dir):
+        """Should delete the on-disk cache."""
+        (repo_dir / "initial.txt").write_text("modified content")
+        get_cached_diff(repo_with_commit, "initial.txt")
+
+        clear_diff_cache(repo_with_commit)
+        assert not get_diff_cache_dir(repo_with_commit).exists()
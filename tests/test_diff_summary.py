@@ -0,0 +1,57 @@
+"""Unit tests for diff_summary module."""
+
+from uncommit.diff_summary import iter_diff_lines, summarize_diff
+
+
+HEADER = "diff --git a/app.py b/app.py\nindex 1111111..2222222 100644\n--- a/app.py\n+++ b/app.py"
+
+
+def _hunk(start: int, lines: int) -> str:
+    """Build a hunk header plus body adding `lines` lines at `start`."""
+    body = "\n".join(f"+line {start + i}" for i in range(lines))
+    return f"@@ -{start},0 +{start},{lines} @@\n{body}"
+
+
+class TestSummarizeDiff:
+    """Tests for summarize_diff function."""
+
+    def test_empty_diff(self):
+        """Should return empty input unchanged."""
+        assert summarize_diff("") == ""
+
+    def test_small_diff_unchanged(self):
+        """Should keep small diffs verbatim."""
+        diff = f"{HEADER}\n{_hunk(10, 3)}"
+        assert summarize_diff(diff) == diff
+
+    def test_truncates_long_hunk(self):
+        """Should cap lines per hunk and note how many were dropped."""
+        diff = f"{HEADER}\n{_hunk(1, 50)}"
+        summary = summarize_diff(diff, max_lines_per_hunk=10)
+
+        assert "+line 10" in summary
+        assert "+line 11" not in summary
+        assert "[40 more lines in this hunk]" in summary
+
+    def test_omits_extra_hunks_with_ranges(self):
+        """Should replace hunks beyond the limit with their line ranges."""
+        hunks = "\n".join(_hunk(start, 5) for start in (10, 40, 70, 100))
+        summary = summarize_diff(f"{HEADER}\n{hunks}", max_hunks=2)
+
+        assert summary.startswith(HEADER)
+        assert "@@ -40,0 +40,5 @@" in summary
+        assert "@@ -70,0 +70,5 @@" not in summary
+        assert "[2 more hunks covering lines 70-74, 100-104]" in summary
+
+
+class TestIterDiffLines:
+    """Tests for iter_diff_lines function."""
+
+    def test_streamed_matches_text(self):
+        """Should give the same summary as the full text, across split chunks."""
+        text = f"{HEADER}\n{_hunk(1, 3)}\n+caf\u00e9"
+        raw = (text + "\n").encode()
+        chunks = [raw[i:i + 7] for i in range(0, len(raw), 7)]
+
+        assert list(iter_diff_lines(chunks)) == text.split("\n")
+        assert summarize_diff(iter_diff_lines(chunks)) == summarize_diff(text)
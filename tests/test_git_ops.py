@@ -1,21 +1,30 @@
 """Unit tests for git_ops module."""
 
+import io
 import os
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
-from git import Repo
 
+from uncommit import git_ops
 from uncommit.git_ops import (
+    BINARY_CHECK_BYTES,
+    MAX_DIFF_BYTES,
+    BatchReader,
     get_repo,
+    invalidate_repo_cache,
     get_repo_root,
     get_uncommitted_files,
     get_diff,
+    get_diffs_batch,
+    get_changes_fingerprint,
     get_file_content,
     get_recent_commits,
     get_directory_structure,
     stage_files,
+    reset_and_stage,
     create_commit,
     unstage_all,
     get_last_commit,
@@ -24,30 +33,6 @@ from uncommit.git_ops import (
 )
 
 
-@pytest.fixture
-def temp_repo(tmp_path):
-    """Create a temporary git repository for testing."""
-    repo = Repo.init(tmp_path)
-    
-    # Configure git user for commits
-    repo.config_writer().set_value("user", "name", "Test User").release()
-    repo.config_writer().set_value("user", "email", "test@example.com").release()
-    
-    return repo
-
-
-@pytest.fixture
-def repo_with_commit(temp_repo, tmp_path):
-    """Create a repo with an initial commit."""
-    # Create a file and commit it
-    test_file = tmp_path / "initial.txt"
-    test_file.write_text("initial content")
-    temp_repo.index.add(["initial.txt"])
-    temp_repo.index.commit("Initial commit")
-    
-    return temp_repo
-
-
 class TestGetRepo:
     """Tests for get_repo function."""
     
@@ -65,6 +50,14 @@ class TestGetRepo:
         
         with pytest.raises(GitError, match="Not a git repository"):
             get_repo(non_git_dir)
+    
+    def test_cached_handle(self, temp_repo, tmp_path):
+        """Should reuse the Repo handle until the cache is invalidated."""
+        first = get_repo(tmp_path)
+        assert get_repo(tmp_path) is first
+        
+        invalidate_repo_cache()
+        assert get_repo(tmp_path) is not first
 
 
 class TestGetRepoRoot:
@@ -84,9 +77,9 @@ class TestGetUncommittedFiles:
         changes = get_uncommitted_files(repo_with_commit)
         assert changes == []
     
-    def test_untracked_file(self, repo_with_commit, tmp_path):
+    def test_untracked_file(self, repo_with_commit, repo_dir):
         """Should detect untracked files."""
-        new_file = tmp_path / "new.txt"
+        new_file = repo_dir / "new.txt"
         new_file.write_text("new content")
         
         changes = get_uncommitted_files(repo_with_commit)
@@ -94,9 +87,9 @@ class TestGetUncommittedFiles:
         assert changes[0].path == "new.txt"
         assert changes[0].status == "added"
     
-    def test_modified_file(self, repo_with_commit, tmp_path):
+    def test_modified_file(self, repo_with_commit, repo_dir):
         """Should detect modified files."""
-        existing = tmp_path / "initial.txt"
+        existing = repo_dir / "initial.txt"
         existing.write_text("modified content")
         
         changes = get_uncommitted_files(repo_with_commit)
@@ -104,6 +97,15 @@ class TestGetUncommittedFiles:
         assert changes[0].path == "initial.txt"
         assert changes[0].status == "modified"
     
+    def test_diff_is_lazy(self, repo_with_commit, repo_dir):
+        """Should fetch a change's diff only when it is accessed."""
+        (repo_dir / "initial.txt").write_text("modified content")
+        
+        change = get_uncommitted_files(repo_with_commit)[0]
+        assert change._diff is None
+        assert "+modified content" in change.diff
+        assert "diff" not in change.model_dump()
+    
     def test_fresh_repo_with_untracked(self, temp_repo, tmp_path):
         """Should work with fresh repo (no commits) and untracked files."""
         new_file = tmp_path / "first.txt"
@@ -112,32 +114,197 @@ class TestGetUncommittedFiles:
         changes = get_uncommitted_files(temp_repo)
         assert len(changes) == 1
         assert changes[0].status == "added"
+    
+    def test_staged_statuses(self, repo_with_commit, repo_dir):
+        """Should report staged renames and additions once each."""
+        repo_with_commit.git.mv("initial.txt", "renamed.txt")
+        (repo_dir / "staged.txt").write_text("staged")
+        stage_files(repo_with_commit, ["staged.txt"])
+        (repo_dir / "staged.txt").write_text("staged, then edited")
+        
+        changes = {c.path: c.status for c in get_uncommitted_files(repo_with_commit)}
+        assert changes == {"renamed.txt": "renamed", "staged.txt": "added"}
 
 
 class TestGetDiff:
     """Tests for get_diff function."""
     
-    def test_diff_modified_file(self, repo_with_commit, tmp_path):
+    def test_diff_modified_file(self, repo_with_commit, repo_dir):
         """Should return diff for modified file."""
-        existing = tmp_path / "initial.txt"
+        existing = repo_dir / "initial.txt"
         existing.write_text("modified content")
         
         diff = get_diff(repo_with_commit, "initial.txt")
         assert "initial content" in diff or "modified content" in diff
+    
+    def test_max_bytes_truncates(self, repo_with_commit, repo_dir):
+        """Should stop reading at max_bytes and mark the diff truncated."""
+        (repo_dir / "big.txt").write_text("line\n" * 5000)
+        
+        diff = get_diff(repo_with_commit, "big.txt", max_bytes=1000)
+        assert "+line" in diff
+        assert diff.endswith("... [truncated]")
+        assert len(diff) < 1100
+    
+    def test_untracked_read_is_bounded(self, repo_with_commit, repo_dir, monkeypatch):
+        """Should read only about max_bytes of a large untracked file."""
+        (repo_dir / "big.log").write_text("line\n" * 400_000)
+        read_sizes = []
+        
+        class CountingFile(io.FileIO):
+            def read(self, size=-1):
+                data = super().read(size)
+                read_sizes.append(len(data))
+                return data
+        
+        monkeypatch.setattr(git_ops, "open", lambda path, mode: CountingFile(path, "r"), raising=False)
+        
+        diff = get_diff(repo_with_commit, "big.log", max_bytes=2000)
+        assert diff.startswith("diff --git a/big.log b/big.log")
+        assert diff.endswith("\n... [truncated]")
+        assert len(diff) <= 2000 + len("\n... [truncated]")
+        assert 0 < sum(read_sizes) <= BINARY_CHECK_BYTES + 1
+        
+        read_sizes.clear()
+        batch = get_diffs_batch(repo_with_commit, ["big.log"])["big.log"]
+        assert batch.endswith("\n... [truncated]")
+        assert 0 < sum(read_sizes) <= MAX_DIFF_BYTES + 1
+    
+    def test_error_includes_git_message(self, temp_repo):
+        """Should report git's own error message when git diff fails."""
+        with pytest.raises(GitError, match="bad revision"):
+            get_diff(temp_repo, "missing.txt")
+    
+    def test_large_stderr_does_not_block(self, temp_repo, monkeypatch):
+        """Should drain stderr while reading stdout, so a chatty git can't stall."""
+        script = "import sys; sys.stderr.write('e' * 200_000); print('out'); sys.exit(3)"
+        monkeypatch.setattr(git_ops, "_git_command", lambda *args: [sys.executable, "-c", script])
+        
+        with pytest.raises(GitError, match="e{1000}"):
+            get_diff(temp_repo)
+
+
+class TestGetDiffsBatch:
+    """Tests for get_diffs_batch function."""
+    
+    def test_splits_per_file(self, repo_with_commit, repo_dir):
+        """Should map each path to its own diff section."""
+        (repo_dir / "other.txt").write_text("other")
+        stage_files(repo_with_commit, ["other.txt"])
+        create_commit(repo_with_commit, "Add other")
+        (repo_dir / "initial.txt").write_text("changed initial")
+        (repo_dir / "other.txt").write_text("changed other")
+        
+        diffs = get_diffs_batch(repo_with_commit, ["initial.txt", "other.txt"])
+        assert "+changed initial" in diffs["initial.txt"]
+        assert "other" not in diffs["initial.txt"]
+        assert "+changed other" in diffs["other.txt"]
+    
+    def test_untracked_file(self, repo_with_commit, repo_dir):
+        """Should build a new-file diff for untracked files."""
+        (repo_dir / "new.txt").write_text("brand new")
+        
+        diffs = get_diffs_batch(repo_with_commit, ["new.txt"])
+        assert "new file mode" in diffs["new.txt"]
+        assert "+brand new" in diffs["new.txt"]
+    
+    def test_quoted_tracked_paths(self, repo_with_commit, repo_dir):
+        """Should split sections whose header paths git C-quotes."""
+        paths = ["my file.py", 'q"x.py', "tab\there.py"]
+        for path in paths:
+            (repo_dir / path).write_text("old\n")
+        stage_files(repo_with_commit, paths)
+        create_commit(repo_with_commit, "Add quoted paths")
+        for path in paths:
+            (repo_dir / path).write_text(f"new {path}\n")
+        
+        diffs = get_diffs_batch(repo_with_commit, paths)
+        for path in paths:
+            assert "new file mode" not in diffs[path]
+            assert diffs[path].count("diff --git") == 1
+            assert f"+new {path}" in diffs[path]
+    
+    def test_untracked_binary(self, repo_with_commit, repo_dir):
+        """Should report untracked binary files the way git does."""
+        (repo_dir / "blob.bin").write_bytes(b"\x00\x01\x02")
+        
+        diffs = get_diffs_batch(repo_with_commit, ["blob.bin"])
+        assert "Binary files /dev/null and b/blob.bin differ" in diffs["blob.bin"]
+
+
+class TestGetChangesFingerprint:
+    """Tests for get_changes_fingerprint function."""
+    
+    def test_stable_for_same_state(self, repo_with_commit, repo_dir):
+        """Should return the same fingerprint when nothing changed."""
+        (repo_dir / "initial.txt").write_text("modified content")
+        changes = get_uncommitted_files(repo_with_commit)
+        
+        first = get_changes_fingerprint(repo_with_commit, changes)
+        assert get_changes_fingerprint(repo_with_commit, changes) == first
+    
+    def test_changes_with_content(self, repo_with_commit, repo_dir):
+        """Should return a new fingerprint when a file is edited."""
+        target = repo_dir / "initial.txt"
+        target.write_text("first edit")
+        first = get_changes_fingerprint(repo_with_commit, get_uncommitted_files(repo_with_commit))
+        
+        target.write_text("second edit")
+        second = get_changes_fingerprint(repo_with_commit, get_uncommitted_files(repo_with_commit))
+        assert first != second
 
 
 class TestGetFileContent:
     """Tests for get_file_content function."""
     
-    def test_read_existing_file(self, repo_with_commit, tmp_path):
+    def test_read_existing_file(self, repo_with_commit, repo_dir):
         """Should read file content."""
         content = get_file_content(repo_with_commit, "initial.txt")
         assert content == "initial content"
     
+    def test_large_file_truncated(self, repo_with_commit, repo_dir):
+        """Should only read up to max_bytes of large files."""
+        (repo_dir / "big.txt").write_text("a" * 50)
+        
+        content = get_file_content(repo_with_commit, "big.txt", max_bytes=10)
+        assert content == "a" * 10 + "\n... [truncated]"
+    
+    def test_binary_file(self, repo_with_commit, repo_dir):
+        """Should reject binary files whether or not they exceed max_bytes."""
+        (repo_dir / "small.bin").write_bytes(b"\x00\xff" * 4)
+        (repo_dir / "large.bin").write_bytes(b"\x00\xff" * 100)
+        
+        for name in ("small.bin", "large.bin"):
+            with pytest.raises(GitError, match="Cannot read binary file"):
+                get_file_content(repo_with_commit, name, max_bytes=50)
+    
     def test_missing_file(self, repo_with_commit):
         """Should raise GitError for missing file."""
         with pytest.raises(GitError, match="File not found"):
             get_file_content(repo_with_commit, "nonexistent.txt")
+    
+    def test_read_at_ref(self, repo_with_commit, repo_dir):
+        """Should read the committed version when a ref is given."""
+        (repo_dir / "initial.txt").write_text("modified")
+        
+        content = get_file_content(repo_with_commit, "initial.txt", ref="HEAD")
+        assert content == "initial content"
+        with pytest.raises(GitError, match="File not found"):
+            get_file_content(repo_with_commit, "nonexistent.txt", ref="HEAD")
+        with pytest.raises(GitError, match="File not found"):
+            get_file_content(repo_with_commit, "no such.txt", ref="HEAD")
+    
+    def test_shared_batch_reader(self, repo_with_commit, repo_dir):
+        """Should serve several reads from one BatchReader."""
+        (repo_dir / "second.txt").write_text("second")
+        repo_with_commit.index.add(["second.txt"])
+        repo_with_commit.index.commit("Add second")
+        
+        with BatchReader(repo_with_commit) as reader:
+            first = get_file_content(repo_with_commit, "initial.txt", ref="HEAD", reader=reader)
+            second = get_file_content(repo_with_commit, "second.txt", ref="HEAD", reader=reader)
+            previous = reader.read("HEAD~1:initial.txt")
+        assert (first, second, previous) == ("initial content", "second", b"initial content")
 
 
 class TestGetRecentCommits:
@@ -158,48 +325,95 @@ class TestGetRecentCommits:
 class TestGetDirectoryStructure:
     """Tests for get_directory_structure function."""
     
-    def test_returns_tree(self, repo_with_commit, tmp_path):
+    def test_returns_tree(self, repo_with_commit, repo_dir):
         """Should return directory tree."""
         structure = get_directory_structure(repo_with_commit)
         assert "initial.txt" in structure
+    
+    def test_caps_entries_per_dir(self, repo_with_commit, repo_dir):
+        """Should list at most max_entries_per_dir entries plus a marker."""
+        for i in range(10):
+            (repo_dir / f"file{i}.txt").write_text("x")
+        
+        structure = get_directory_structure(repo_with_commit, max_entries_per_dir=5)
+        assert "file4.txt" in structure
+        assert "file5.txt" not in structure
+        assert "... (+6 more)" in structure
+    
+    def test_skips_gitignored(self, repo_with_commit, repo_dir):
+        """Should leave out files and directories ignored by git."""
+        (repo_dir / ".gitignore").write_text("build/\n*.log\n")
+        (repo_dir / "build").mkdir()
+        (repo_dir / "build" / "out.bin").write_text("x")
+        (repo_dir / "debug.log").write_text("x")
+        
+        structure = get_directory_structure(repo_with_commit)
+        assert "initial.txt" in structure
+        assert "build" not in structure
+        assert "debug.log" not in structure
 
 
 class TestStageFiles:
     """Tests for stage_files function."""
     
-    def test_stage_untracked(self, repo_with_commit, tmp_path):
+    def test_stage_untracked(self, repo_with_commit, repo_dir):
         """Should stage untracked files."""
-        new_file = tmp_path / "staged.txt"
+        new_file = repo_dir / "staged.txt"
         new_file.write_text("staged content")
         
         stage_files(repo_with_commit, ["staged.txt"])
         
         # Check file is staged
-        staged = [item.a_path for item in repo_with_commit.index.diff("HEAD")]
-        assert "staged.txt" in staged or len(repo_with_commit.index.diff("HEAD")) > 0
+        staged = repo_with_commit.git.diff("--cached", "--name-only").splitlines()
+        assert staged == ["staged.txt"]
+
+
+class TestResetAndStage:
+    """Tests for reset_and_stage function."""
+    
+    def test_replaces_staged_set(self, repo_with_commit, repo_dir):
+        """Should unstage previous files and stage only the given ones."""
+        (repo_dir / "first.txt").write_text("first")
+        (repo_dir / "second.txt").write_text("second")
+        stage_files(repo_with_commit, ["first.txt"])
+        
+        reset_and_stage(repo_with_commit, ["second.txt"])
+        
+        staged = repo_with_commit.git.diff("--cached", "--name-only").splitlines()
+        assert staged == ["second.txt"]
 
 
 class TestCreateCommit:
     """Tests for create_commit function."""
     
-    def test_create_commit(self, repo_with_commit, tmp_path):
+    def test_create_commit(self, repo_with_commit, repo_dir):
         """Should create a commit."""
-        new_file = tmp_path / "to_commit.txt"
+        new_file = repo_dir / "to_commit.txt"
         new_file.write_text("commit me")
         
         stage_files(repo_with_commit, ["to_commit.txt"])
         commit_hash = create_commit(repo_with_commit, "Test commit")
         
         assert len(commit_hash) == 7
+        assert repo_with_commit.head.commit.hexsha.startswith(commit_hash)
         assert repo_with_commit.head.commit.message.strip() == "Test commit"
+    
+    def test_root_commit(self, temp_repo, tmp_path):
+        """Should return the hash of the first commit in a repo."""
+        (tmp_path / "first.txt").write_text("first")
+        
+        stage_files(temp_repo, ["first.txt"])
+        commit_hash = create_commit(temp_repo, "First commit")
+        
+        assert temp_repo.head.commit.hexsha.startswith(commit_hash)
 
 
 class TestUnstageAll:
     """Tests for unstage_all function."""
     
-    def test_unstage(self, repo_with_commit, tmp_path):
+    def test_unstage(self, repo_with_commit, repo_dir):
         """Should unstage all staged files."""
-        new_file = tmp_path / "staged.txt"
+        new_file = repo_dir / "staged.txt"
         new_file.write_text("content")
         stage_files(repo_with_commit, ["staged.txt"])
         
@@ -218,6 +432,15 @@ class TestGetLastCommit:
         assert last.message == "Initial commit"
         assert len(last.hash) == 7
     
+    def test_first_line_of_message(self, repo_with_commit, repo_dir):
+        """Should return only the first message line, even with unusual line breaks."""
+        (repo_dir / "second.txt").write_text("second")
+        stage_files(repo_with_commit, ["second.txt"])
+        create_commit(repo_with_commit, "Wrapped \u2028subject\nsecond line\n\nBody")
+        
+        last = get_last_commit(repo_with_commit)
+        assert last.message == "Wrapped \u2028subject"
+    
     def test_fresh_repo(self, temp_repo):
         """Should return None for fresh repo."""
         last = get_last_commit(temp_repo)
@@ -227,10 +450,10 @@ class TestGetLastCommit:
 class TestUndoLastCommit:
     """Tests for undo_last_commit function."""
     
-    def test_undo_mixed(self, repo_with_commit, tmp_path):
+    def test_undo_mixed(self, repo_with_commit, repo_dir):
         """Should undo commit with mixed mode (unstaged)."""
         # Create a second commit
-        new_file = tmp_path / "second.txt"
+        new_file = repo_dir / "second.txt"
         new_file.write_text("second")
         stage_files(repo_with_commit, ["second.txt"])
         create_commit(repo_with_commit, "Second commit")
@@ -240,9 +463,9 @@ class TestUndoLastCommit:
         assert undone.message == "Second commit"
         assert get_last_commit(repo_with_commit).message == "Initial commit"
     
-    def test_undo_soft(self, repo_with_commit, tmp_path):
+    def test_undo_soft(self, repo_with_commit, repo_dir):
         """Should undo commit with soft mode (staged)."""
-        new_file = tmp_path / "third.txt"
+        new_file = repo_dir / "third.txt"
         new_file.write_text("third")
         stage_files(repo_with_commit, ["third.txt"])
         create_commit(repo_with_commit, "Third commit")
@@ -251,6 +474,18 @@ class TestUndoLastCommit:
         
         assert undone.message == "Third commit"
     
+    def test_undo_with_known_commit(self, repo_with_commit, repo_dir):
+        """Should undo HEAD and return the commit the caller passed in."""
+        (repo_dir / "fourth.txt").write_text("fourth")
+        stage_files(repo_with_commit, ["fourth.txt"])
+        create_commit(repo_with_commit, "Fourth commit")
+        last = get_last_commit(repo_with_commit)
+        
+        undone = undo_last_commit(repo_with_commit, last_commit=last)
+        
+        assert undone is last
+        assert get_last_commit(repo_with_commit).message == "Initial commit"
+    
     def test_undo_no_commits(self, temp_repo):
         """Should raise GitError when no commits to undo."""
         with pytest.raises(GitError, match="No commits to undo"):
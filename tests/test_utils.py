@@ -0,0 +1,74 @@
+"""Unit tests for utils module."""
+
+import json
+
+import pytest
+
+from uncommit import utils
+from uncommit.utils import JsonObjectScanner, dumps_json, extract_json_object, loads_json
+
+
+class TestJsonObjectScanner:
+    """Tests for JsonObjectScanner class."""
+
+    def test_complete_in_one_chunk(self):
+        """Should return the object when fed all at once."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('{"groups": []}') == '{"groups": []}'
+
+    def test_split_across_chunks(self):
+        """Should only return once the closing brace arrives."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('Here you go: {"groups": [{"index"') is None
+        assert scanner.feed(': 1}]}\n```') == '{"groups": [{"index": 1}]}'
+
+    def test_braces_inside_strings(self):
+        """Should ignore braces and escaped quotes inside strings."""
+        scanner = JsonObjectScanner()
+        text = '{"reasoning": "uses {} and \\"}\\"", "n": {"a": 1}} trailing }'
+        assert scanner.feed(text) == '{"reasoning": "uses {} and \\"}\\"", "n": {"a": 1}}'
+
+    def test_incomplete(self):
+        """Should return None and keep the raw text for unfinished objects."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('{"groups": [') is None
+        assert scanner.text == '{"groups": ['
+
+
+class TestExtractJsonObject:
+    """Tests for extract_json_object function."""
+
+    def test_markdown_fenced(self):
+        """Should pull the object out of a fenced code block."""
+        text = 'Sure!\n```json\n{"groups": [], "warnings": null}\n```\nLet me know {if} needed.'
+        assert extract_json_object(text) == '{"groups": [], "warnings": null}'
+
+    def test_no_object(self):
+        """Should return None when there is no complete object."""
+        assert extract_json_object("no json here") is None
+
+
+class TestJsonHelpers:
+    """Tests for dumps_json and loads_json functions."""
+
+    def test_round_trip(self):
+        """Should serialize and parse back the same data."""
+        data = {"files": [{"path": "a.py", "status": "modified"}], "count": 1}
+        assert loads_json(dumps_json(data, indent=True)) == data
+
+    def test_same_output_without_orjson(self, monkeypatch):
+        """Should produce identical text with and without orjson."""
+        data = {"files": [{"path": "é.py", "status": "added"}], "count": 1}
+        expected = [
+            '{"files":[{"path":"é.py","status":"added"}],"count":1}',
+            '{\n  "files": [\n    {\n      "path": "é.py",\n      "status": "added"\n'
+            '    }\n  ],\n  "count": 1\n}',
+        ]
+
+        monkeypatch.setattr(utils, "orjson", None)
+        assert [dumps_json(data), dumps_json(data, indent=True)] == expected
+
+    def test_invalid_raises_decode_error(self):
+        """Should raise a json.JSONDecodeError subclass on invalid input."""
+        with pytest.raises(json.JSONDecodeError):
+            loads_json("{not json")